@@ -5,99 +5,83 @@ This file sets up the Streamlit configuration, applies custom
 styling, constructs the sidebar navigation and routes user
 interactions to the appropriate page modules.  Pages are organised
 into groups (Reports, Analytics, Tools and Reference) for a clean
-sidebar.  The navigation state is preserved in Streamlit session
-state.
+sidebar.  Routing uses Streamlit's native ``st.navigation``, which
+keeps the selected page in the URL.
 """
 
 from __future__ import annotations
 
+import importlib
+import itertools
+from typing import Callable, Final
+
 import streamlit as st
 
 import config
 import utils
-from modules import (
-    home,
-    profit_loss,
-    balance_sheet,
-    cash_flow,
-    comparison,
-    time_series,
-    account_details,
-    forecasting,
-    subscription_tracking,
-    debt_payoff,
-    list_management,
-    task_management,
-    wiki,
-    doc_processing,
-    chatbot,
-    reference,
-    transaction_mapping,
-    list_management_admin,
+
+
+@st.cache_resource
+def _get_render(modpath: str) -> Callable[[], None]:
+    """Import a page module on first use and return its ``render`` function."""
+    return importlib.import_module(modpath).render
+
+
+# Single source of truth for navigation: (group, page name, module path)
+_PAGES = (
+    ("Home", "Home", "modules.home"),
+    ("Reports", "Profit & Loss", "modules.profit_loss"),
+    ("Reports", "Balance Sheet", "modules.balance_sheet"),
+    ("Reports", "Cash Flow", "modules.cash_flow"),
+    ("Reports", "Comparisons", "modules.comparison"),
+    ("Analytics", "Time Series", "modules.time_series"),
+    ("Tools", "Account Details", "modules.account_details"),
+    ("Tools", "Forecasting", "modules.forecasting"),
+    ("Tools", "Subscription Tracking", "modules.subscription_tracking"),
+    ("Tools", "Debt Payoff Calculator", "modules.debt_payoff"),
+    ("Tools", "List Management", "modules.list_management"),
+    ("Tools", "Task Management", "modules.task_management"),
+    ("Tools", "Personal Wiki/Notes", "modules.wiki"),
+    ("Tools", "Document Processing", "modules.doc_processing"),
+    ("Tools", "Chatbot", "modules.chatbot"),
+    ("Reference", "Reference & Resources", "modules.reference"),
+    ("Admin Center", "Transaction Mapping", "modules.transaction_mapping"),
+    ("Admin Center", "List Management Admin", "modules.list_management_admin"),
+)
+
+
+_HIDE_CSS: Final[str] = (
+    "<style>#MainMenu{visibility:hidden;}footer{visibility:hidden;}"
+    "header{visibility:hidden;}</style>"
 )
 
 
-def create_sidebar_navigation() -> str:
-    """Create sidebar navigation and return the selected page name."""
+def _lazy_page(modpath: str) -> Callable[[], None]:
+    """Return a page callable that imports its module only when run."""
+    def page() -> None:
+        _get_render(modpath)()
+    return page
+
+
+def create_sidebar_navigation() -> st.Page:
+    """Create sidebar navigation and return the selected page."""
     st.sidebar.markdown(f"## {config.config.title}")
     st.sidebar.markdown("---")
-    # Initialize session state
-    if "current_page" not in st.session_state:
-        st.session_state.current_page = "Home"
-    navigation_groups = {
-        "Home": {"pages": {"Home": home.render}},
-        "Reports": {
-            "pages": {
-                "Profit & Loss": profit_loss.render,
-                "Balance Sheet": balance_sheet.render,
-                "Cash Flow": cash_flow.render,
-                "Comparisons": comparison.render,
-            }
-        },
-        "Analytics": {
-            "pages": {
-                "Time Series": time_series.render,
-            }
-        },
-        "Tools": {
-            "pages": {
-                "Account Details": account_details.render,
-                "Forecasting": forecasting.render,
-                "Subscription Tracking": subscription_tracking.render,
-                "Debt Payoff Calculator": debt_payoff.render,
-                "List Management": list_management.render,
-                "Task Management": task_management.render,
-                "Personal Wiki/Notes": wiki.render,
-                "Document Processing": doc_processing.render,
-                "Chatbot": chatbot.render,
-            }
-        },
-        "Reference": {
-            "pages": {
-                "Reference & Resources": reference.render,
-            }
-        },
-        "Admin Center": {
-            "pages": {
-                "Transaction Mapping": transaction_mapping.render,
-                "List Management Admin": list_management_admin.render,
-            }
-        },
-    }
-    selected_page = None
-    # Render navigation
-    for group_name, group_data in navigation_groups.items():
-        if group_name == "Home":
-            if st.sidebar.button("🏠 Home", key=f"nav_{group_name}"):
-                st.session_state.current_page = "Home"
-                selected_page = "Home"
-        else:
-            with st.sidebar.expander(group_name, expanded=True):
-                for page_name, render_func in group_data["pages"].items():
-                    if st.button(f"• {page_name}", key=f"nav_{page_name}"):
-                        st.session_state.current_page = page_name
-                        selected_page = page_name
-    return selected_page
+    sections = {}
+    for group_name, pages in itertools.groupby(_PAGES, key=lambda page: page[0]):
+        # The Home page sits above the grouped sections without a header
+        header = "" if group_name == "Home" else group_name
+        sections[header] = [
+            st.Page(
+                _lazy_page(modpath),
+                title=page_name,
+                icon="🏠" if page_name == "Home" else None,
+                url_path=modpath.rsplit(".", 1)[-1],
+                default=page_name == "Home",
+            )
+            for _, page_name, modpath in pages
+        ]
+    return st.navigation(sections)
 
 
 def main() -> None:
@@ -108,48 +92,11 @@ def main() -> None:
         layout=config.config.layout,
         initial_sidebar_state=config.config.initial_sidebar_state,
     )
-    # Hide default menu and footer
-    st.markdown(
-        """
-        <style>
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
-    utils.apply_custom_css()
-    
-    selected_page = create_sidebar_navigation()
-    if selected_page:
-        st.session_state.current_page = selected_page
-    # Render selected page
-    current_page = st.session_state.get("current_page", "Home")
-    # Build a mapping of page names to render functions
-    all_pages = {
-        "Home": home.render,
-        "Profit & Loss": profit_loss.render,
-        "Balance Sheet": balance_sheet.render,
-        "Cash Flow": cash_flow.render,
-        "Comparisons": comparison.render,
-        "Time Series": time_series.render,
-        "Account Details": account_details.render,
-        "Forecasting": forecasting.render,
-        "Subscription Tracking": subscription_tracking.render,
-        "Debt Payoff Calculator": debt_payoff.render,
-        "List Management": list_management.render,
-        "Task Management": task_management.render,
-        "Personal Wiki/Notes": wiki.render,
-        "Document Processing": doc_processing.render,
-        "Chatbot": chatbot.render,
-        "Reference & Resources": reference.render,
-        "Transaction Mapping": transaction_mapping.render,
-        "List Management Admin": list_management_admin.render,
-    }
-    render_func = all_pages.get(current_page, home.render)
-    render_func()
+    # Hide default menu and footer alongside the custom styling in one element
+    utils.apply_custom_css(_HIDE_CSS)
+
+    create_sidebar_navigation().run()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -8,12 +8,15 @@ with their credentials stored securely.
 
 import streamlit as st
 import hashlib
+import hmac
 import secrets
-import json
 import os
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-import pandas as pd
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+import orjson
 
 
 class AuthManager:
@@ -21,7 +24,13 @@ class AuthManager:
     
     def __init__(self):
         self.users_file = "data/users.json"
-        self.sessions_file = "data/sessions.json"
+        self.sessions_db = "data/auth.db"
+        # Parsed users file keyed by (st_mtime_ns, st_size) of the file
+        self._users_cache = (None, None)
+        # Serialises read-modify-write of users.json across sessions
+        self._lock = threading.RLock()
+        # Verified against for unknown usernames so lookups cost the same
+        self._dummy_user = self._new_password_record(secrets.token_urlsafe(16))
         self._ensure_data_files()
     
     def _ensure_data_files(self):
@@ -32,7 +41,7 @@ class AuthManager:
         if not os.path.exists(self.users_file):
             default_users = {
                 "user1": {
-                    "password_hash": self._hash_password("test1pw"),
+                    **self._new_password_record("test1pw"),
                     "email": "user1@example.com",
                     "created_at": datetime.now().isoformat(),
                     "role": "user"
@@ -40,141 +49,244 @@ class AuthManager:
             }
             self._save_users(default_users)
         
-        # Create sessions file if it doesn't exist
-        if not os.path.exists(self.sessions_file):
-            self._save_sessions({})
+        # Open the sessions store; Streamlit reruns may come from any thread
+        self.db = sqlite3.connect(
+            self.sessions_db, isolation_level=None, check_same_thread=False
+        )
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "token TEXT PRIMARY KEY, username TEXT NOT NULL, "
+            "created_at INTEGER NOT NULL, expires_at INTEGER NOT NULL)"
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions (expires_at)"
+        )
+        
+        # In-memory token -> (username, expires_at) index, written through to the db.
+        # Only a hint: another process (or a rebuilt manager) may log a token
+        # out, which bumps the db's data_version and drops the index
+        self._db_version = self._sessions_version()
+        self._session_index: Dict[str, Tuple[str, int]] = {
+            token: (username, expires_at)
+            for token, username, expires_at in self.db.execute(
+                "SELECT token, username, expires_at FROM sessions WHERE expires_at > ?",
+                (int(time.time()),),
+            )
+        }
+    
+    def _sessions_version(self) -> int:
+        """Return SQLite's data_version, which changes on other connections' commits."""
+        return self.db.execute("PRAGMA data_version").fetchone()[0]
+    
+    def _hash_password(self, password: str, salt: bytes) -> str:
+        """Hash a password with scrypt using the given salt."""
+        return hashlib.scrypt(
+            password.encode(), salt=salt, n=2**14, r=8, p=1, dklen=32
+        ).hex()
+    
+    def _new_password_record(self, password: str) -> Dict[str, str]:
+        """Create the salt and hash fields stored for a password."""
+        salt = secrets.token_bytes(16)
+        return {
+            "password_salt": salt.hex(),
+            "password_hash": self._hash_password(password, salt),
+        }
     
-    def _hash_password(self, password: str) -> str:
-        """Hash a password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _verify_password(self, user: Dict[str, Any], password: str) -> bool:
+        """Check a password against a stored user record."""
+        if "password_salt" in user:
+            candidate = self._hash_password(password, bytes.fromhex(user["password_salt"]))
+        else:
+            # Legacy records hold an unsalted SHA-256 digest
+            candidate = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(user["password_hash"], candidate)
     
     def _generate_session_token(self) -> str:
         """Generate a secure session token."""
         return secrets.token_urlsafe(32)
     
-    def _load_users(self) -> Dict[str, Any]:
-        """Load users from file."""
+    @staticmethod
+    def _file_key(path: str) -> Optional[tuple]:
+        """Return a cheap change-detection key for a file, or None if missing."""
         try:
-            with open(self.users_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-    
-    def _save_users(self, users: Dict[str, Any]):
-        """Save users to file."""
-        with open(self.users_file, 'w') as f:
-            json.dump(users, f, indent=2)
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
     
-    def _load_sessions(self) -> Dict[str, Any]:
-        """Load sessions from file."""
+    def _load_users(self) -> Dict[str, Any]:
+        """Load users from file, reusing the parsed copy if unchanged.
+
+        The returned dict is shared with the cache: build changes on a copy
+        and hand that to ``_save_users``.
+        """
+        key = self._file_key(self.users_file)
+        if key is not None and key == self._users_cache[0]:
+            return self._users_cache[1]
         try:
-            with open(self.sessions_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.users_file, 'rb') as f:
+                users = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return {}
+        self._users_cache = (key, users)
+        return users
     
-    def _save_sessions(self, sessions: Dict[str, Any]):
-        """Save sessions to file."""
-        with open(self.sessions_file, 'w') as f:
-            json.dump(sessions, f, indent=2)
+    def _save_users(self, users: Dict[str, Any]):
+        """Save users to file atomically so a crash never leaves it half-written."""
+        tmp_file = self.users_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(users, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.users_file)
+        self._users_cache = (self._file_key(self.users_file), users)
     
     def register_user(self, username: str, password: str, email: str) -> bool:
         """Register a new user."""
-        users = self._load_users()
-        
-        if username in users:
-            return False  # Username already exists
-        
-        users[username] = {
-            "password_hash": self._hash_password(password),
-            "email": email,
-            "created_at": datetime.now().isoformat(),
-            "role": "user"
-        }
-        
-        self._save_users(users)
+        with self._lock:
+            users = {**self._load_users()}
+            
+            if username in users:
+                return False  # Username already exists
+            
+            users[username] = {
+                **self._new_password_record(password),
+                "email": email,
+                "created_at": datetime.now().isoformat(),
+                "role": "user"
+            }
+            
+            self._save_users(users)
         return True
     
     def login_user(self, username: str, password: str) -> Optional[str]:
         """Login a user and return session token."""
         users = self._load_users()
+        user = users.get(username, self._dummy_user)
         
-        if username not in users:
+        # Always hash so unknown usernames take as long as wrong passwords
+        if not self._verify_password(user, password) or username not in users:
             return None
         
-        user = users[username]
-        if user["password_hash"] != self._hash_password(password):
-            return None
+        if "password_salt" not in user:
+            # Upgrade legacy SHA-256 records to scrypt on successful login,
+            # re-reading under the lock so other writers' changes are kept
+            record = self._new_password_record(password)
+            with self._lock:
+                users = self._load_users()
+                current = users.get(username)
+                if current is not None and current.get("password_hash") == user["password_hash"]:
+                    self._save_users({**users, username: {**current, **record}})
         
         # Generate session token
         session_token = self._generate_session_token()
-        sessions = self._load_sessions()
+        now = int(time.time())
         
-        sessions[session_token] = {
-            "username": username,
-            "created_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(hours=24)).isoformat()
-        }
+        expires_at = now + 24 * 60 * 60
         
-        self._save_sessions(sessions)
+        # Drop expired sessions before adding the new one
+        self.db.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        self.db.execute(
+            "INSERT INTO sessions (token, username, created_at, expires_at) VALUES (?, ?, ?, ?)",
+            (session_token, username, now, expires_at),
+        )
+        with self._lock:
+            self._session_index = {
+                token: entry
+                for token, entry in self._session_index.items()
+                if entry[1] > now
+            }
+            self._session_index[session_token] = (username, expires_at)
         return session_token
     
     def logout_user(self, session_token: str):
         """Logout a user by removing their session."""
-        sessions = self._load_sessions()
-        if session_token in sessions:
-            del sessions[session_token]
-            self._save_sessions(sessions)
+        with self._lock:
+            self._session_index.pop(session_token, None)
+            self.db.execute("DELETE FROM sessions WHERE token = ?", (session_token,))
     
-    def validate_session(self, session_token: str) -> Optional[str]:
-        """Validate a session token and return username if valid."""
-        sessions = self._load_sessions()
-        
-        if session_token not in sessions:
-            return None
+    def get_session(self, session_token: str) -> Optional[Tuple[str, int]]:
+        """Return ``(username, expires_at)`` for a valid session token.
+
+        ``expires_at`` is a Unix timestamp in seconds. Lookups hit the
+        in-memory index first and only fall back to the db on a miss. The
+        index is discarded whenever another connection has written to the
+        sessions db, so logouts elsewhere take effect immediately; that
+        check is a ``PRAGMA data_version`` call, so every lookup still
+        makes one cheap SQLite call.
+        """
+        with self._lock:
+            version = self._sessions_version()
+            if version != self._db_version:
+                self._db_version = version
+                self._session_index = {}
+            row = self._session_index.get(session_token)
+            
+            if row is None:
+                row = self.db.execute(
+                    "SELECT username, expires_at FROM sessions WHERE token = ?", (session_token,)
+                ).fetchone()
+                if row is None:
+                    return None
+                self._session_index[session_token] = row
         
-        session = sessions[session_token]
-        expires_at = datetime.fromisoformat(session["expires_at"])
+        username, expires_at = row
         
-        if datetime.now() > expires_at:
+        if time.time() > expires_at:
             # Session expired, remove it
-            del sessions[session_token]
-            self._save_sessions(sessions)
+            self.logout_user(session_token)
             return None
         
-        return session["username"]
+        return username, expires_at
+    
+    def validate_session(self, session_token: str) -> Optional[str]:
+        """Validate a session token and return username if valid."""
+        session = self.get_session(session_token)
+        return session[0] if session else None
     
     def get_user_info(self, username: str) -> Optional[Dict[str, Any]]:
-        """Get user information."""
-        users = self._load_users()
-        return users.get(username)
+        """Get user information.
+
+        Served from the mtime-keyed users cache, so repeated lookups within
+        a rerun do not re-read the file.
+        """
+        user = self._load_users().get(username)
+        return dict(user) if user is not None else None
     
     def change_password(self, username: str, old_password: str, new_password: str) -> bool:
         """Change user password."""
         users = self._load_users()
+        user = users.get(username, self._dummy_user)
         
-        if username not in users:
+        if not self._verify_password(user, old_password) or username not in users:
             return False
         
-        user = users[username]
-        if user["password_hash"] != self._hash_password(old_password):
-            return False
-        
-        user["password_hash"] = self._hash_password(new_password)
-        self._save_users(users)
+        # Hash outside the lock, then re-read so other writers' changes are kept
+        record = self._new_password_record(new_password)
+        with self._lock:
+            users = self._load_users()
+            current = users.get(username)
+            if current is None or current.get("password_hash") != user["password_hash"]:
+                return False  # Removed or changed since the old password was checked
+            self._save_users({**users, username: {**current, **record}})
         return True
 
 
+@st.cache_resource
+def get_auth_manager() -> AuthManager:
+    """Return the process-wide authentication manager."""
+    return AuthManager()
+
+
 def init_auth():
     """Initialize authentication in Streamlit session state."""
-    if "auth_manager" not in st.session_state:
-        st.session_state.auth_manager = AuthManager()
-    
-    if "session_token" not in st.session_state:
-        st.session_state.session_token = None
-    
-    if "current_user" not in st.session_state:
-        st.session_state.current_user = None
+    for key, value in (
+        ("auth_manager", get_auth_manager()),
+        ("session_token", None),
+        ("current_user", None),
+    ):
+        st.session_state.setdefault(key, value)
 
 
 def login_page() -> bool:
@@ -280,6 +392,7 @@ def logout():
     st.session_state.session_token = None
     st.session_state.current_user = None
     st.session_state.show_register = False
+    st.session_state.pop("_auth_validated", None)
 
 
 def require_auth():
@@ -353,15 +466,23 @@ def main_auth():
     """Main authentication flow."""
     init_auth()
     
-    # Validate existing session
-    if st.session_state.session_token:
-        username = st.session_state.auth_manager.validate_session(st.session_state.session_token)
-        if username:
-            st.session_state.current_user = username
+    # Validate existing session, reusing this session's last check until expiry
+    token = st.session_state.session_token
+    if token:
+        validated = st.session_state.get("_auth_validated")
+        if validated and validated[0] == token and time.time() < validated[2]:
+            st.session_state.current_user = validated[1]
         else:
-            # Session expired
-            st.session_state.session_token = None
-            st.session_state.current_user = None
+            session = st.session_state.auth_manager.get_session(token)
+            if session:
+                username, expires_at = session
+                st.session_state.current_user = username
+                st.session_state._auth_validated = (token, username, expires_at)
+            else:
+                # Session expired
+                st.session_state.session_token = None
+                st.session_state.current_user = None
+                st.session_state.pop("_auth_validated", None)
     
     # Show registration page if requested
     if st.session_state.get("show_register", False):
@@ -7,44 +7,104 @@ and user management features.
 
 import streamlit as st
 import streamlit_authenticator as stauth
-import yaml
+import orjson
 import os
 from datetime import datetime
 
 
-def init_auth():
-    """Initialize authentication system."""
-    # Create config file if it doesn't exist
-    config_file = "data/auth_config.yaml"
-    os.makedirs("data", exist_ok=True)
+CONFIG_FILE = "data/auth_config.json"
+# Written by earlier versions; converted to CONFIG_FILE on first use
+LEGACY_CONFIG_FILE = "data/auth_config.yaml"
+
+
+@st.cache_data(show_spinner=False)
+def _load_config(config_file: str, mtime: float) -> dict:
+    """Parse the authenticator config; ``mtime`` keys the cache entry."""
+    with open(config_file, 'rb') as file:
+        return orjson.loads(file.read())
+
+
+def _hash_password(password: str) -> str:
+    """Bcrypt-hash ``password`` with whichever Hasher API is installed."""
+    if hasattr(stauth.Hasher, 'hash'):
+        # streamlit-authenticator 0.4+
+        return stauth.Hasher.hash(password)
+    return stauth.Hasher([password]).generate()[0]
+
+
+def _migrate_legacy_config(config_file: str = CONFIG_FILE, legacy_file: str = LEGACY_CONFIG_FILE) -> bool:
+    """Convert an existing YAML config to the JSON ``config_file``.
+
+    Returns ``True`` if a legacy file was found and converted.
+    """
+    if not os.path.exists(legacy_file):
+        return False
+    # PyYAML ships with streamlit-authenticator; only needed for this one-off
+    import yaml
+    with open(legacy_file) as file:
+        config = yaml.load(file, Loader=yaml.SafeLoader)
+    with open(config_file, 'wb') as file:
+        file.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    return True
+
+
+def bootstrap_config_if_missing(config_file: str = CONFIG_FILE) -> bool:
+    """Write the configuration if none exists.
+
+    An existing ``auth_config.yaml`` from earlier versions is converted;
+    otherwise the default demo user is written.  That hashes the demo
+    password with bcrypt, so it is normally run offline from
+    ``scripts/init_auth.py`` rather than on a visitor's page load.
+    Returns ``True`` if a new file was written.
+    """
+    os.makedirs(os.path.dirname(config_file), exist_ok=True)
+    if os.path.exists(config_file):
+        return False
+    if _migrate_legacy_config(config_file):
+        return True
     
-    if not os.path.exists(config_file):
-        # Create default configuration
-        config = {
-            'credentials': {
-                'usernames': {
-                    'user1': {
-                        'email': 'user1@example.com',
-                        'name': 'Demo User',
-                        'password': stauth.Hasher(['test1pw']).generate()
-                    }
+    # Create default configuration
+    config = {
+        'credentials': {
+            'usernames': {
+                'user1': {
+                    'email': 'user1@example.com',
+                    'name': 'Demo User',
+                    'password': _hash_password('test1pw')
                 }
-            },
-            'cookie': {
-                'expiry_days': 30,
-                'key': 'some_signature_key',
-                'name': 'some_cookie_name'
             }
+        },
+        'cookie': {
+            'expiry_days': 30,
+            'key': 'some_signature_key',
+            'name': 'some_cookie_name'
         }
-        
-        with open(config_file, 'w') as file:
-            yaml.dump(config, file, default_flow_style=False)
+    }
     
-    # Load configuration
-    with open(config_file) as file:
-        config = yaml.load(file, Loader=yaml.SafeLoader)
+    with open(config_file, 'wb') as file:
+        file.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    return True
+
+
+def init_auth():
+    """Initialize authentication system."""
+    config_file = CONFIG_FILE
+    if not os.path.exists(config_file):
+        # Existing deployments keep working: convert their YAML config, or
+        # fall back to the defaults once and say so
+        has_legacy = os.path.exists(LEGACY_CONFIG_FILE)
+        bootstrap_config_if_missing(config_file)
+        if not has_legacy:
+            st.warning(
+                "No authentication config found, so the default demo user was created. "
+                "Run `python scripts/init_auth.py` during deployment to avoid this."
+            )
+    
+    # Load configuration (parsed once per file version)
+    config = _load_config(config_file, os.path.getmtime(config_file))
     
-    # Create authenticator
+    # Create authenticator (per run: it renders the cookie component and
+    # initialises this session's state, so it cannot be shared)
     authenticator = stauth.Authenticate(
         config['credentials'],
         config['cookie']['name'],
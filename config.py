@@ -13,8 +13,17 @@ consumed subsets of the configuration.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Set
+
+
+# Default data directories, resolved once at import
+_DATA_RAW_DIR = os.path.join(os.getcwd(), "data", "raw")
+_DATA_PROCESSED_DIR = os.path.join(os.getcwd(), "data", "processed")
+
+# Directories already created by this process
+_created_dirs: Set[str] = set()
 
 
 @dataclass
@@ -63,8 +72,8 @@ class AppConfig:
     initial_sidebar_state: str = "expanded"
 
     # Data settings
-    data_raw_dir: str = field(default_factory=lambda: os.path.join(os.getcwd(), "data", "raw"))
-    data_processed_dir: str = field(default_factory=lambda: os.path.join(os.getcwd(), "data", "processed"))
+    data_raw_dir: str = _DATA_RAW_DIR
+    data_processed_dir: str = _DATA_PROCESSED_DIR
     cache_ttl: int = 3600  # 1 hour
 
     # User settings
@@ -76,28 +85,45 @@ class AppConfig:
     max_display_rows: int = 1000
 
     def __post_init__(self) -> None:
-        """Ensure data directories exist."""
-        os.makedirs(self.data_raw_dir, exist_ok=True)
-        os.makedirs(self.data_processed_dir, exist_ok=True)
+        """Ensure data directories exist (once per directory per process)."""
+        for path in (self.data_raw_dir, self.data_processed_dir):
+            if path not in _created_dirs:
+                os.makedirs(path, exist_ok=True)
+                _created_dirs.add(path)
 
 
 # Instantiate a global configuration object
 config = AppConfig()
 
 
-def get_chart_config() -> Dict[str, Any]:
-    """Return the default chart configuration for Plotly charts."""
-    return {
+# Read-only defaults shared by every caller; copy with ``{**cfg, ...}`` to override.
+# Nested values are read-only too, and get_chart_config hands out copies
+_CHART_MARGIN: Mapping[str, int] = MappingProxyType({"l": 50, "r": 50, "t": 50, "b": 50})
+_CHART_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
         "height": config.chart_height,
-        "margin": {"l": 50, "r": 50, "t": 50, "b": 50},
+        "margin": _CHART_MARGIN,
         "showlegend": True,
         "hovermode": "closest",
     }
+)
+_TABLE_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "use_container_width": True,
+        "height": config.table_height,
+    }
+)
 
 
-def get_table_config() -> Dict[str, Any]:
+def get_chart_config() -> Dict[str, Any]:
+    """Return a fresh copy of the default chart configuration for Plotly charts.
+
+    The nested ``margin`` is copied as well, so callers may change the
+    result without affecting other charts.
+    """
+    return {**_CHART_CONFIG, "margin": dict(_CHART_MARGIN)}
+
+
+def get_table_config() -> Mapping[str, Any]:
     """Return the default table configuration for Streamlit dataframes."""
-    return {
-        "use_container_width": True,
-        "height": config.table_height,
-    }
\ No newline at end of file
+    return _TABLE_CONFIG
@@ -18,19 +18,42 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import re
-from difflib import get_close_matches
+from rapidfuzz import fuzz, process
 import streamlit as st
 
 import utils
 import config
 
+# Pattern: transaction-raw-import-[bank]_[type]_[last4]-YYYY.MM.DD-YYYY.MM.DD.csv
+_FILENAME_RE = re.compile(
+    r'transaction-raw-import-([^_]+)_([^_]+)_(\d{4})-\d{4}\.\d{2}\.\d{2}-\d{4}\.\d{2}\.\d{2}'
+)
+
+# Mapping file fields and the DataFrame columns they populate
+MAPPING_COLUMNS = {
+    'account_type': 'AccountType',
+    'category1': 'Category1',
+    'category2': 'Category2',
+    'category3': 'Category3',
+    'tags': 'Tags',
+    'payer': 'Payer',
+    'payee': 'Payee',
+}
+
+# Low-cardinality text columns stored as categoricals in the combined file
+CATEGORICAL_COLUMNS = [
+    'Bank', 'AccountType', 'AccountLast4', 'BankAccount',
+    'Category1', 'Category2', 'Category3', 'Payer', 'Payee',
+    'MappedDescription', 'TransactionType', 'PeriodMonth', 'PeriodQuarter',
+]
+
 
 class DataProcessor:
     """Enhanced data processor for transaction files."""
     
     def __init__(self):
         self.mapping_file = os.path.join("data", "processed", "transaction_mappings.json")
-        self.combined_file = os.path.join("data", "processed", "transactions_combined_enhanced.csv")
+        self.combined_file = os.path.join("data", "processed", "transactions_combined_enhanced.parquet")
         self.mappings = self._load_mappings()
         
     def _load_mappings(self) -> Dict:
@@ -66,107 +89,110 @@ class DataProcessor:
         with open(self.mapping_file, 'w', encoding='utf-8') as f:
             json.dump(mappings, f, indent=2, ensure_ascii=False)
     
-    def _extract_filename_metadata(self, filename: str) -> Tuple[str, str, str]:
-        """Extract bank name, account type, and last 4 digits from filename."""
-        # Pattern: transaction-raw-import-[bank]_[type]_[last4]-YYYY.MM.DD-YYYY.MM.DD.csv
-        pattern = r'transaction-raw-import-([^_]+)_([^_]+)_(\d{4})-\d{4}\.\d{2}\.\d{2}-\d{4}\.\d{2}\.\d{2}'
-        match = re.search(pattern, filename)
-        
-        if match:
-            bank = match.group(1).upper()
-            account_type = match.group(2).upper()
-            last4 = match.group(3)
-            return bank, account_type, last4
-        else:
-            return "UNKNOWN", "UNKNOWN", "0000"
+    def _extract_filename_metadata(self, filenames: pd.Series) -> pd.DataFrame:
+        """Extract bank name, account type, and last 4 digits from filenames."""
+        metadata = filenames.str.extract(_FILENAME_RE)
+        metadata.columns = ['Bank', 'AccountType', 'AccountLast4']
+        
+        metadata['Bank'] = metadata['Bank'].str.upper()
+        metadata['AccountType'] = metadata['AccountType'].str.upper()
+        return metadata.fillna({'Bank': 'UNKNOWN', 'AccountType': 'UNKNOWN', 'AccountLast4': '0000'})
     
     def _add_period_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add formatted period columns to DataFrame."""
-        df = df.copy()
-        
+        """Add formatted period columns to DataFrame in place."""
         # Ensure Date column is datetime
         df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
         
-        # Add period columns
-        df['PeriodYear'] = df['Date'].dt.strftime('%Y')
-        df['PeriodMonth'] = df['Date'].dt.strftime('%m-%Y')
-        df['PeriodQuarter'] = df['Date'].dt.apply(
-            lambda x: f"Q{(x.month-1)//3 + 1}-{x.year}" if pd.notnull(x) else None
-        )
+        # Add period columns from the integer date parts; NaT rows stay empty.
+        # The year is kept as a small integer, the labels become categoricals
+        valid = df['Date'].notna()
+        year = df['Date'].dt.year.astype('Int64').astype(str)
+        month = df['Date'].dt.month.astype('Int64').astype(str).str.zfill(2)
+        quarter = df['Date'].dt.quarter.astype('Int64').astype(str)
+        df['PeriodYear'] = df['Date'].dt.year.astype('Int16')
+        df['PeriodMonth'] = (month + '-' + year).where(valid)
+        df['PeriodQuarter'] = ('Q' + quarter + '-' + year).where(valid)
         
         return df
     
-    def _find_best_match(self, description: str, existing_mappings: List[str]) -> Optional[str]:
-        """Find the best matching description from existing mappings."""
-        if not existing_mappings:
-            return None
-        
-        # Try exact match first
-        if description in existing_mappings:
-            return description
-        
-        # Try partial matches (case insensitive)
-        description_lower = description.lower()
-        for mapping in existing_mappings:
-            if description_lower in mapping.lower() or mapping.lower() in description_lower:
+    def _find_partial_match(self, description_lower: str, lowered_mappings: List[Tuple[str, str]]) -> Optional[str]:
+        """Find a substring match from ``(lowered_key, key)`` pairs of existing mappings."""
+        for mapping_lower, mapping in lowered_mappings:
+            if description_lower in mapping_lower or mapping_lower in description_lower:
                 return mapping
         
-        # Try fuzzy matching
-        matches = get_close_matches(description, existing_mappings, n=1, cutoff=0.6)
-        return matches[0] if matches else None
+        return None
+    
+    def _find_fuzzy_matches(self, descriptions: List[str], existing_mappings: List[str]) -> Dict[str, Optional[str]]:
+        """Fuzzy-match many descriptions against existing mappings in one batch."""
+        if not descriptions or not existing_mappings:
+            return dict.fromkeys(descriptions)
+        
+        scores = process.cdist(
+            descriptions, existing_mappings, scorer=fuzz.ratio, score_cutoff=60, workers=-1
+        )
+        best = scores.argmax(axis=1)
+        found = scores[np.arange(len(descriptions)), best] > 0
+        return {
+            description: existing_mappings[index] if ok else None
+            for description, index, ok in zip(descriptions, best, found)
+        }
     
     def _apply_mappings(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply mappings to DataFrame."""
-        df = df.copy()
-        
-        # Initialize new columns
-        df['AccountType'] = None
-        df['Category1'] = None
-        df['Category2'] = None
-        df['Category3'] = None
-        df['Tags'] = None
-        df['Payer'] = None
-        df['Payee'] = None
-        df['MappedDescription'] = None
-        
-        # Get existing mapping keys
-        existing_descriptions = list(self.mappings.get('mappings', {}).keys())
-        
-        for idx, row in df.iterrows():
-            description = str(row['Description']).strip()
-            
-            # Find best match
-            best_match = self._find_best_match(description, existing_descriptions)
-            
-            if best_match:
-                mapping = self.mappings['mappings'][best_match]
-                df.at[idx, 'AccountType'] = mapping.get('account_type')
-                df.at[idx, 'Category1'] = mapping.get('category1')
-                df.at[idx, 'Category2'] = mapping.get('category2')
-                df.at[idx, 'Category3'] = mapping.get('category3')
-                df.at[idx, 'Tags'] = mapping.get('tags')
-                df.at[idx, 'Payer'] = mapping.get('payer')
-                df.at[idx, 'Payee'] = mapping.get('payee')
-                df.at[idx, 'MappedDescription'] = best_match
+        """Apply mappings to DataFrame in place."""
+        mappings = self.mappings.get('mappings', {})
+        
+        # Normalize descriptions and mapping keys once up front
+        descriptions = df['Description'].astype('string').str.strip()
+        normalized = descriptions.str.lower()
+        existing_descriptions = list(mappings.keys())
+        lowered_mappings = [(key.lower(), key) for key in existing_descriptions]
+        keys_norm = {}
+        for key_lower, key in lowered_mappings:
+            keys_norm.setdefault(key_lower, key)
+        
+        # Exact hits (then case-insensitive ones) are the common case
+        mapped_description = descriptions.where(
+            descriptions.isin(existing_descriptions), normalized.map(keys_norm)
+        )
+        unresolved = mapped_description.isna() & descriptions.notna()
+        
+        # Resolve each distinct remaining description once
+        remaining = dict(zip(descriptions[unresolved], normalized[unresolved]))
+        best_matches = {
+            description: self._find_partial_match(description_lower, lowered_mappings)
+            for description, description_lower in remaining.items()
+        }
+        residual = [description for description, match in best_matches.items() if match is None]
+        best_matches.update(self._find_fuzzy_matches(residual, existing_descriptions))
+        mapped_description = mapped_description.fillna(descriptions.map(best_matches))
+        
+        mapping_df = pd.DataFrame.from_dict(mappings, orient='index')
+        mapping_df = mapping_df.reindex(columns=list(MAPPING_COLUMNS)).rename(columns=MAPPING_COLUMNS)
+        
+        fields = mapping_df.reindex(mapped_description)
+        for column in fields.columns:
+            df[column] = fields[column].to_numpy()
+        df['MappedDescription'] = mapped_description
         
         return df
     
     def _detect_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Detect and mark duplicate transactions."""
-        df = df.copy()
-        
-        # Create a composite key for duplicate detection
-        df['DuplicateKey'] = df.apply(
-            lambda row: f"{row['Date']}_{row['Amount']}_{row['Description']}_{row['Bank']}_{row['AccountLast4']}", 
-            axis=1
+        """Detect and mark duplicate transactions in place."""
+        # Mark duplicates (keep first occurrence) on the identifying columns
+        df['IsDuplicate'] = df.duplicated(
+            subset=['Date', 'Amount', 'Description', 'Bank', 'AccountLast4'], keep='first'
         )
         
-        # Mark duplicates (keep first occurrence)
-        df['IsDuplicate'] = df.duplicated(subset=['DuplicateKey'], keep='first')
-        
-        # Remove duplicate key column
-        df = df.drop('DuplicateKey', axis=1)
+        return df
+    
+    def _save_combined(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Write the combined dataset to Parquet and return the saved frame."""
+        # Dictionary-encode repeated labels; Parquet keeps the categoricals
+        df[CATEGORICAL_COLUMNS] = df[CATEGORICAL_COLUMNS].astype('category')
         
+        os.makedirs(os.path.dirname(self.combined_file), exist_ok=True)
+        df.to_parquet(self.combined_file, index=False, compression='zstd')
         return df
     
     def process_all_files(self) -> pd.DataFrame:
@@ -179,12 +205,11 @@ class DataProcessor:
             return pd.DataFrame()
         
         # Add filename metadata
-        df['Bank'] = df['FileName'].apply(lambda x: self._extract_filename_metadata(x)[0])
-        df['AccountType'] = df['FileName'].apply(lambda x: self._extract_filename_metadata(x)[1])
-        df['AccountLast4'] = df['FileName'].apply(lambda x: self._extract_filename_metadata(x)[2])
+        metadata = self._extract_filename_metadata(df['FileName'])
+        df[['Bank', 'AccountType', 'AccountLast4']] = metadata
         
         # Create bank account identifier
-        df['BankAccount'] = df['Bank'] + ' ' + df['AccountType'] + ' ' + df['AccountLast4']
+        df['BankAccount'] = df['Bank'].str.cat([df['AccountType'], df['AccountLast4']], sep=' ')
         
         # Add period columns
         df = self._add_period_columns(df)
@@ -202,8 +227,7 @@ class DataProcessor:
         df = df.sort_values('Date', ascending=False)
         
         # Save combined file
-        os.makedirs(os.path.dirname(self.combined_file), exist_ok=True)
-        df.to_csv(self.combined_file, index=False)
+        df = self._save_combined(df)
         
         # Log processing results
         total_transactions = len(df)
@@ -252,8 +276,25 @@ class DataProcessor:
         self.mappings['mappings'][description] = mapping_data
         self._save_mappings(self.mappings)
         
-        # Reprocess data to apply new mapping
-        self.process_all_files()
+        if not os.path.exists(self.combined_file):
+            # Nothing processed yet, so build the combined file from scratch
+            self.process_all_files()
+            return
+        
+        # Only rows without an exact match, or already mapped to this
+        # description, can change; re-match those on the saved dataset
+        df = pd.read_parquet(self.combined_file)
+        mapped_description = df['MappedDescription'].astype('string')
+        affected = (
+            (mapped_description != df['Description'].astype('string').str.strip())
+            | (mapped_description == description)
+        ).fillna(True)
+        
+        updated = self._apply_mappings(df.loc[affected].copy())
+        columns = list(MAPPING_COLUMNS.values()) + ['MappedDescription']
+        df[columns] = df[columns].astype(object)
+        df.loc[affected, columns] = updated[columns]
+        self._save_combined(df)
     
     def get_mapping_lists(self) -> Dict:
         """Get available options for mapping dropdowns."""
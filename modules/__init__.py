@@ -1,18 +1,34 @@
-"""Export page modules for easy import in app.py."""
+"""Export page modules for easy import in app.py.
 
-from . import home
-from . import profit_loss
-from . import balance_sheet
-from . import cash_flow
-from . import comparison
-from . import time_series
-from . import account_details
-from . import forecasting
-from . import subscription_tracking
-from . import debt_payoff
-from . import list_management
-from . import task_management
-from . import wiki
-from . import doc_processing
-from . import chatbot
-from . import reference
\ No newline at end of file
+Page modules are imported lazily on first attribute access so that
+importing the package does not pull in every page's dependencies.
+"""
+
+import importlib
+
+__all__ = [
+    "home",
+    "profit_loss",
+    "balance_sheet",
+    "cash_flow",
+    "comparison",
+    "time_series",
+    "account_details",
+    "forecasting",
+    "subscription_tracking",
+    "debt_payoff",
+    "list_management",
+    "task_management",
+    "wiki",
+    "doc_processing",
+    "chatbot",
+    "reference",
+    "transaction_mapping",
+    "list_management_admin",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -17,37 +17,23 @@ import streamlit as st
 import utils
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
-
-
 def render() -> None:
     st.title("Account Details")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
     # Select account
-    # Extract bank name and last 4 digits from Bank_Account column
-    def extract_account_info(bank_account):
-        """Extract bank name and last 4 digits from Bank_Account column."""
-        if pd.isna(bank_account):
-            return "Unknown Account"
-        parts = str(bank_account).split('_')
-        if len(parts) >= 2:
-            bank_name = parts[0].upper()
-            last4 = parts[1][-4:] if len(parts[1]) >= 4 else parts[1]
-            return f"{bank_name} {last4}"
-        return str(bank_account).upper()
-    
-    df['AccountDisplay'] = df['Bank_Account'].apply(extract_account_info)
-    accounts = sorted(df['AccountDisplay'].unique())
-    account = st.sidebar.selectbox("Select an account", accounts)
-    acc_df = df[df['AccountDisplay'] == account]
+    # Account labels ("BOA 7259") are precomputed by the shared loader
+    # and stored as a categorical, so filter on its integer codes
+    account_codes = df['AccountDisplay'].cat.codes
+    accounts = df['AccountDisplay'].cat.categories
+    account = st.sidebar.selectbox("Select an account", list(accounts))
+    acc_df = df.loc[account_codes == accounts.get_loc(account)]
     # Date range
-    min_date = acc_df["Date"].min().date() if pd.notnull(acc_df["Date"].min()) else date.today()
-    max_date = acc_df["Date"].max().date() if pd.notnull(acc_df["Date"].max()) else date.today()
+    first_date, last_date = acc_df["Date"].agg(["min", "max"])
+    min_date = first_date.date() if pd.notnull(first_date) else date.today()
+    max_date = last_date.date() if pd.notnull(last_date) else date.today()
     start_date, end_date = st.sidebar.date_input(
         "Date range", value=(min_date, max_date), min_value=min_date, max_value=max_date
     )
@@ -62,4 +48,5 @@ def render() -> None:
     # Export
     st.markdown("### Export data")
     utils.add_download_button(acc_df, f"{account.replace(' ', '_').lower()}_transactions.csv", "Download CSV")
-    utils.add_excel_download_button(acc_df, f"{account.replace(' ', '_').lower()}_transactions.xlsx", "Download Excel")
\ No newline at end of file
+    utils.add_excel_download_button(acc_df, f"{account.replace(' ', '_').lower()}_transactions.xlsx", "Download Excel")
+    utils.add_arrow_download_button(acc_df, f"{account.replace(' ', '_').lower()}_transactions.arrow", "Download Arrow")
\ No newline at end of file
@@ -19,11 +19,6 @@ import plotly.express as px
 import utils
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
-
-
 def compute_account_balances(df: pd.DataFrame) -> pd.DataFrame:
     """Compute the latest balance for each account.
 
@@ -37,42 +32,32 @@ def compute_account_balances(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with columns: Account, Bank, AccountType, Last4, Balance.
     """
-    accounts = []
+    # Account info is encoded in Bank_Account (format: "BOA_7259")
+    balances = df.groupby("Bank_Account", observed=True)["Amount"].sum().reset_index()
+    bank_account = balances["Bank_Account"].astype(str)
+    parts = bank_account.str.split("_")
+    has_last4 = parts.str.len() >= 2
     
-    # Extract account info from Bank_Account column (format: "BOA_7259")
-    def extract_account_info(bank_account):
-        if pd.isna(bank_account):
-            return "Unknown", "Unknown", "0000"
-        parts = str(bank_account).split('_')
-        if len(parts) >= 2:
-            bank_name = parts[0].upper()
-            last4 = parts[1][-4:] if len(parts[1]) >= 4 else parts[1]
-            return bank_name, "CHECKING", last4  # Default to checking for demo
-        return str(bank_account).upper(), "UNKNOWN", "0000"
+    bank_name = parts.str[0].str.upper().where(has_last4, bank_account.str.upper())
+    # Default to checking for demo
+    acct_type = pd.Series(np.where(has_last4, "CHECKING", "UNKNOWN"), index=balances.index)
+    last4 = parts.str[1].str[-4:].where(has_last4, "0000")
     
-    # Group by Bank_Account since that's what we have in enhanced data
-    for bank_account, subdf in df.groupby("Bank_Account"):
-        subdf = subdf.sort_values("Date")
-        bank_name, acct_type, last4 = extract_account_info(bank_account)
-        
-        # Use cumulative sum of Amount for balance
-        balance = subdf["Amount"].sum()
-        
-        accounts.append(
-            {
-                "Account": f"{bank_name} {acct_type} {last4}",
-                "Bank": bank_name.title(),
-                "AccountType": acct_type.title(),
-                "Last4": last4,
-                "Balance": balance,
-            }
-        )
-    return pd.DataFrame(accounts)
+    return pd.DataFrame(
+        {
+            "Account": bank_name + " " + acct_type + " " + last4,
+            "Bank": bank_name.str.title(),
+            "AccountType": acct_type.str.title(),
+            "Last4": last4,
+            # Sum of Amount per account is the balance
+            "Balance": balances["Amount"],
+        }
+    )
 
 
 def render() -> None:
     st.title("Balance Sheet")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
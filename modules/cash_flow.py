@@ -13,6 +13,7 @@ from __future__ import annotations
 from datetime import date
 from typing import List
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.express as px
@@ -20,31 +21,14 @@ import plotly.express as px
 import utils
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
-
-
 def render() -> None:
     st.title("Cash Flow")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
     st.sidebar.markdown("### Filters")
-    # Extract bank name and last 4 digits from Bank_Account column
-    def extract_account_info(bank_account):
-        """Extract bank name and last 4 digits from Bank_Account column."""
-        if pd.isna(bank_account):
-            return "Unknown Account"
-        parts = str(bank_account).split('_')
-        if len(parts) >= 2:
-            bank_name = parts[0].upper()
-            last4 = parts[1][-4:] if len(parts[1]) >= 4 else parts[1]
-            return f"{bank_name} {last4}"
-        return str(bank_account).upper()
-    
-    df['AccountDisplay'] = df['Bank_Account'].apply(extract_account_info)
+    # Account labels ("BOA 7259") are precomputed by the shared loader
     accounts = sorted(df['AccountDisplay'].unique())
     selected_accounts = st.sidebar.multiselect(
         "Select accounts", options=accounts, default=accounts
@@ -83,7 +67,10 @@ def render() -> None:
     if period == "Monthly":
         cash_flow["PeriodDisplay"] = cash_flow["Period"].dt.strftime("%Y-%m")
     elif period == "Quarterly":
-        cash_flow["PeriodDisplay"] = cash_flow["Period"].dt.strftime("%Y-Q%q")
+        # strftime has no quarter directive, so build "YYYY-Qn" from the date parts
+        cash_flow["PeriodDisplay"] = (
+            cash_flow["Period"].dt.year.astype(str) + "-Q" + cash_flow["Period"].dt.quarter.astype(str)
+        )
     else:
         cash_flow["PeriodDisplay"] = cash_flow["Period"].dt.strftime("%Y")
     
@@ -101,7 +88,8 @@ def render() -> None:
     
     # Format display dataframe
     display_df = cash_flow.copy()
-    display_df["NetCash"] = display_df["NetCash"].apply(lambda x: f"${format_accounting(x)}")
+    net_abs = display_df["NetCash"].abs().map("{:,.2f}".format)
+    display_df["NetCash"] = np.where(display_df["NetCash"] < 0, "$(" + net_abs + ")", "$" + net_abs)
     period_label = {"Monthly": "Month", "Quarterly": "Quarter", "Yearly": "Year"}.get(period, "Period")
     utils.display_dataframe(display_df.rename(columns={"PeriodDisplay": period_label, "NetCash": "Net Cash Flow"}))
     
@@ -13,7 +13,6 @@ expenses.
 from __future__ import annotations
 
 from datetime import date
-import pandas as pd
 import numpy as np
 import streamlit as st
 import plotly.express as px
@@ -21,14 +20,9 @@ import plotly.express as px
 import utils
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
-
-
 def render() -> None:
     st.title("Comparisons")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
@@ -54,16 +48,11 @@ def render() -> None:
     comparison["Difference"] = comparison["Actual"] - comparison["LastYear"]
     comparison["% Change"] = comparison["Difference"] / comparison["LastYear"]
     st.markdown(f"### Actual vs last {period.lower()}")
-    utils.display_dataframe(
-        comparison[["Period", "Actual", "LastYear", "Difference", "% Change"]].assign(
-            **{
-                "Difference": lambda x: x["Difference"].map(utils.format_currency),
-                "Actual": lambda x: x["Actual"].map(utils.format_currency),
-                "LastYear": lambda x: x["LastYear"].map(utils.format_currency),
-                "% Change": lambda x: (x["% Change"] * 100).round(2).astype(str) + "%",
-            }
-        )
-    )
+    display_df = comparison[["Period", "Actual", "LastYear", "Difference", "% Change"]].copy()
+    for column in ("Actual", "LastYear", "Difference"):
+        display_df[column] = utils.format_currency_series(display_df[column])
+    display_df["% Change"] = utils.format_percentage_series(display_df["% Change"])
+    utils.display_dataframe(display_df)
     # Plot bar chart of actual vs last year
     try:
         chart_df = comparison.melt(id_vars="Period", value_vars=["Actual", "LastYear"], var_name="Category", value_name="Value")
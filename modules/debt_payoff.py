@@ -18,11 +18,6 @@ import plotly.express as px
 import utils
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
-
-
 def compute_account_balances(df: pd.DataFrame) -> pd.DataFrame:
     # reuse logic from balance sheet
     from .balance_sheet import compute_account_balances as bal_fn
@@ -46,38 +41,49 @@ def payoff_schedule(balance: float, annual_rate: float, monthly_payment: float)
     pd.DataFrame
         A schedule with columns for period, interest, principal, payment and remaining balance.
     """
-    records = []
+    columns = ["Month", "Starting Balance", "Payment", "Interest", "Principal", "Ending Balance"]
     monthly_rate = annual_rate / 12.0
-    month = 1
-    current_balance = balance
-    while current_balance > 0 and month <= 1200:  # safety cap to avoid infinite loop
-        interest = current_balance * monthly_rate
-        principal = monthly_payment - interest
-        if principal <= 0:
-            # Payment too low; interest accumulates
-            break
-        new_balance = current_balance - principal
-        if new_balance < 0:
-            principal += new_balance
-            new_balance = 0
-        records.append(
-            {
-                "Month": month,
-                "Starting Balance": current_balance,
-                "Payment": monthly_payment,
-                "Interest": interest,
-                "Principal": principal,
-                "Ending Balance": new_balance,
-            }
+    if balance <= 0 or monthly_payment - balance * monthly_rate <= 0:
+        # Nothing owed, or payment too low so interest accumulates
+        return pd.DataFrame(columns=columns)
+    # Months to payoff in closed form, with a safety cap
+    if monthly_rate > 0:
+        months = np.ceil(
+            -np.log1p(-monthly_rate * balance / monthly_payment) / np.log1p(monthly_rate)
         )
-        current_balance = new_balance
-        month += 1
-    return pd.DataFrame(records)
+    else:
+        months = np.ceil(balance / monthly_payment)
+    periods = np.arange(1, int(min(months, 1200)) + 1)
+    # Balance at the start of each month from the annuity formula
+    if monthly_rate > 0:
+        growth = (1.0 + monthly_rate) ** (periods - 1)
+        starting = balance * growth - monthly_payment * (growth - 1.0) / monthly_rate
+    else:
+        starting = balance - monthly_payment * (periods - 1)
+    starting = starting[starting > 0]
+    interest = starting * monthly_rate
+    principal = monthly_payment - interest
+    ending = starting - principal
+    # The final payment only covers what is left
+    overpaid = ending < 0
+    principal[overpaid] += ending[overpaid]
+    ending[overpaid] = 0.0
+    return pd.DataFrame(
+        {
+            "Month": periods[: len(starting)],
+            "Starting Balance": starting,
+            "Payment": float(monthly_payment),
+            "Interest": interest,
+            "Principal": principal,
+            "Ending Balance": ending,
+        },
+        columns=columns,
+    )
 
 
 def render() -> None:
     st.title("Debt Payoff Calculator")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
@@ -109,17 +115,8 @@ def render() -> None:
         ],
         columns=2,
     )
-    utils.display_dataframe(
-        schedule.assign(
-            **{
-                "Starting Balance": lambda x: x["Starting Balance"].apply(utils.format_currency),
-                "Payment": lambda x: x["Payment"].apply(utils.format_currency),
-                "Interest": lambda x: x["Interest"].apply(utils.format_currency),
-                "Principal": lambda x: x["Principal"].apply(utils.format_currency),
-                "Ending Balance": lambda x: x["Ending Balance"].apply(utils.format_currency),
-            }
-        )
-    )
+    money_columns = ["Starting Balance", "Payment", "Interest", "Principal", "Ending Balance"]
+    utils.display_dataframe(schedule, formats={col: utils.CURRENCY_FMT for col in money_columns})
     st.markdown("### Export schedule")
     utils.add_download_button(schedule, "debt_payoff_schedule.csv", "Download Schedule CSV")
     utils.add_excel_download_button(schedule, "debt_payoff_schedule.xlsx", "Download Schedule Excel")
\ No newline at end of file
@@ -17,15 +17,27 @@ from typing import Optional
 import utils
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_bytes(name: str, data: bytes) -> pd.DataFrame:
+    """Parse uploaded file contents; cached on the name and bytes across reruns."""
+    if name.endswith(".csv"):
+        try:
+            # Multithreaded parser with Arrow-backed columns instead of object dtype
+            return pd.read_csv(io.BytesIO(data), engine="pyarrow", dtype_backend="pyarrow")
+        except Exception:
+            # The pyarrow parser is stricter (e.g. ragged rows); retry with the default one
+            return pd.read_csv(io.BytesIO(data))
+    # openpyxl opens .xlsx workbooks read-only; legacy .xls needs pandas' default engine
+    engine = "openpyxl" if name.endswith(".xlsx") else None
+    return pd.read_excel(io.BytesIO(data), engine=engine)
+
+
 def parse_uploaded_file(uploaded_file) -> Optional[pd.DataFrame]:
+    if not uploaded_file.name.endswith((".csv", ".xlsx", ".xls")):
+        st.warning("Unsupported file type.  Please upload CSV or Excel files.")
+        return None
     try:
-        if uploaded_file.name.endswith(".csv"):
-            return pd.read_csv(uploaded_file)
-        elif uploaded_file.name.endswith(".xlsx") or uploaded_file.name.endswith(".xls"):
-            return pd.read_excel(uploaded_file)
-        else:
-            st.warning("Unsupported file type.  Please upload CSV or Excel files.")
-            return None
+        return _read_bytes(uploaded_file.name, uploaded_file.getvalue())
     except Exception as e:
         st.error(f"Failed to parse file: {e}")
         return None
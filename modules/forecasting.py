@@ -18,14 +18,9 @@ import plotly.express as px
 import utils
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
-
-
 def render() -> None:
     st.title("Cash Flow Forecasting")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
@@ -45,19 +40,13 @@ def render() -> None:
     # Generate forecast
     last_date = monthly_net["Date"].max()
     dates = pd.date_range(start=last_date + pd.offsets.MonthBegin(1), periods=months_ahead, freq="MS")
-    forecast_values = []
-    value = avg_net
-    for i in range(months_ahead):
-        if i == 0:
-            val = avg_net * (1 + growth_rate / 100)
-        else:
-            val = forecast_values[-1] * (1 + growth_rate / 100)
-        forecast_values.append(val)
+    # Compounded monthly growth on the average is a geometric progression
+    forecast_values = avg_net * np.power(1.0 + growth_rate / 100, np.arange(1, months_ahead + 1))
     forecast_df = pd.DataFrame({"Date": dates, "Forecast Net Cash": forecast_values})
-    combined = pd.concat(
-        [monthly_net.rename(columns={"Amount": "Historical Net Cash"})[["Date", "Historical Net Cash"], forecast_df]],
-        ignore_index=True,
-    )
+    # Outer join on Date keeps history and forecast as side-by-side columns
+    combined = pd.merge(
+        monthly_net.rename(columns={"Amount": "Historical Net Cash"}), forecast_df, on="Date", how="outer"
+    ).sort_values("Date")
     # Plot
     try:
         fig = px.line(combined, x="Date", y=["Historical Net Cash", "Forecast Net Cash"], title="Net Cash Forecast")
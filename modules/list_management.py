@@ -11,8 +11,9 @@ entirely new lists.
 
 from __future__ import annotations
 
-import json
 import os
+
+import orjson
 import streamlit as st
 
 from typing import Dict, List
@@ -23,20 +24,31 @@ import utils
 LISTS_FILE = os.path.join("data", "processed", "user_lists.json")
 
 
+@st.cache_data(show_spinner=False)
+def _load_lists_cached(mtime: float) -> Dict[str, List[str]]:
+    """Parse the lists file; ``mtime`` keys the cache entry."""
+    try:
+        with open(LISTS_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except Exception:
+        return {}
+
+
 def load_lists() -> Dict[str, List[str]]:
     if os.path.exists(LISTS_FILE):
-        try:
-            with open(LISTS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
+        return _load_lists_cached(os.path.getmtime(LISTS_FILE))
     return {}
 
 
 def save_lists(lists: Dict[str, List[str]]) -> None:
     os.makedirs(os.path.dirname(LISTS_FILE), exist_ok=True)
-    with open(LISTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(lists, f, indent=2)
+    # Write then rename so a rerun never reads a half-written file
+    tmp_file = LISTS_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(lists, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, LISTS_FILE)
+    # Writes within the filesystem's mtime resolution would otherwise hit a stale entry
+    _load_lists_cached.clear()
 
 
 def render() -> None:
@@ -7,25 +7,45 @@ mapping system and dropdown menus throughout the application.
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, Mapping, Sequence, Tuple
 import os
 import json
 
 
+# Sample mapping lists for demonstration
+_MAPPING_LISTS: Mapping[str, Tuple[str, ...]] = {
+    'account_types': ('income', 'expense', 'transfer', 'investment', 'loan'),
+    'categories': ('Food & Dining', 'Transportation', 'Entertainment', 'Utilities', 'Healthcare', 'Shopping', 'Education', 'Travel', 'Insurance', 'Taxes', 'Investments', 'Gifts', 'Charity', 'Income'),
+    'tags': ('essential', 'luxury', 'monthly', 'annual', 'subscription', 'one-time', 'recurring', 'business', 'personal', 'emergency'),
+    'payers': ('Self', 'Employer', 'Bank', 'Investment', 'Government', 'Insurance'),
+    'payees': ('Grocery Store', 'Gas Station', 'Restaurant', 'Utility Company', 'Internet Provider', 'Phone Company', 'Insurance Company', 'Healthcare Provider', 'Retail Store', 'Online Service', 'Netflix')
+}
+
+_COMMON_ITEMS: Mapping[str, Tuple[str, ...]] = {
+    "account_types": ("income", "expense", "transfer", "investment", "loan"),
+    "categories": (
+        "Food & Dining", "Transportation", "Entertainment", "Utilities",
+        "Healthcare", "Shopping", "Education", "Travel", "Insurance",
+        "Taxes", "Investments", "Gifts", "Charity"
+    ),
+    "tags": (
+        "essential", "luxury", "monthly", "annual", "subscription",
+        "one-time", "recurring", "business", "personal", "emergency"
+    ),
+    "payers": ("Self", "Employer", "Bank", "Investment", "Government", "Insurance"),
+    "payees": (
+        "Grocery Store", "Gas Station", "Restaurant", "Utility Company",
+        "Internet Provider", "Phone Company", "Insurance Company",
+        "Healthcare Provider", "Retail Store", "Online Service"
+    )
+}
+
+
 def render() -> None:
     """Render the list management interface."""
     st.title("List Management")
     st.markdown("Create and customize lists used in transaction mapping and dropdown menus.")
     
-    # Sample mapping lists for demonstration
-    mapping_lists = {
-        'account_types': ['income', 'expense', 'transfer', 'investment', 'loan'],
-        'categories': ['Food & Dining', 'Transportation', 'Entertainment', 'Utilities', 'Healthcare', 'Shopping', 'Education', 'Travel', 'Insurance', 'Taxes', 'Investments', 'Gifts', 'Charity', 'Income'],
-        'tags': ['essential', 'luxury', 'monthly', 'annual', 'subscription', 'one-time', 'recurring', 'business', 'personal', 'emergency'],
-        'payers': ['Self', 'Employer', 'Bank', 'Investment', 'Government', 'Insurance'],
-        'payees': ['Grocery Store', 'Gas Station', 'Restaurant', 'Utility Company', 'Internet Provider', 'Phone Company', 'Insurance Company', 'Healthcare Provider', 'Retail Store', 'Online Service', 'Netflix']
-    }
-    
     st.info("📊 This is a demonstration of the list management interface using sample data.")
     
     # Display current lists
@@ -37,19 +57,19 @@ def render() -> None:
     ])
     
     with tab1:
-        _render_list_editor("account_types", "Account Types", mapping_lists.get('account_types', []))
+        _render_list_editor("account_types", "Account Types", _MAPPING_LISTS.get('account_types', ()))
     
     with tab2:
-        _render_list_editor("categories", "Categories", mapping_lists.get('categories', []))
+        _render_list_editor("categories", "Categories", _MAPPING_LISTS.get('categories', ()))
     
     with tab3:
-        _render_list_editor("tags", "Tags", mapping_lists.get('tags', []))
+        _render_list_editor("tags", "Tags", _MAPPING_LISTS.get('tags', ()))
     
     with tab4:
-        _render_list_editor("payers", "Payers", mapping_lists.get('payers', []))
+        _render_list_editor("payers", "Payers", _MAPPING_LISTS.get('payers', ()))
     
     with tab5:
-        _render_list_editor("payees", "Payees", mapping_lists.get('payees', []))
+        _render_list_editor("payees", "Payees", _MAPPING_LISTS.get('payees', ()))
     
     # Bulk operations
     st.markdown("---")
@@ -84,7 +104,7 @@ def render() -> None:
         if st.button("Export Lists to CSV"):
             # Create export DataFrame
             export_data = []
-            for list_name, items in mapping_lists.items():
+            for list_name, items in _MAPPING_LISTS.items():
                 for item in items:
                     export_data.append({'list_name': list_name, 'item': item})
             
@@ -102,29 +122,10 @@ def render() -> None:
     st.markdown("---")
     st.subheader("Quick Add Common Items")
     
-    common_items = {
-        "account_types": ["income", "expense", "transfer", "investment", "loan"],
-        "categories": [
-            "Food & Dining", "Transportation", "Entertainment", "Utilities", 
-            "Healthcare", "Shopping", "Education", "Travel", "Insurance", 
-            "Taxes", "Investments", "Gifts", "Charity"
-        ],
-        "tags": [
-            "essential", "luxury", "monthly", "annual", "subscription", 
-            "one-time", "recurring", "business", "personal", "emergency"
-        ],
-        "payers": ["Self", "Employer", "Bank", "Investment", "Government", "Insurance"],
-        "payees": [
-            "Grocery Store", "Gas Station", "Restaurant", "Utility Company",
-            "Internet Provider", "Phone Company", "Insurance Company",
-            "Healthcare Provider", "Retail Store", "Online Service"
-        ]
-    }
-    
-    for list_name, items in common_items.items():
+    for list_name, items in _COMMON_ITEMS.items():
         with st.expander(f"Quick Add {list_name.replace('_', ' ').title()}"):
             # Show current items
-            current_items = mapping_lists.get(list_name, [])
+            current_items = set(_MAPPING_LISTS.get(list_name, ()))
             missing_items = [item for item in items if item not in current_items]
             
             if missing_items:
@@ -141,7 +142,7 @@ def render() -> None:
                 st.info(f"All common {list_name} items are already in the list.")
 
 
-def _render_list_editor(list_name: str, display_name: str, current_items: List[str]) -> None:
+def _render_list_editor(list_name: str, display_name: str, current_items: Sequence[str]) -> None:
     """Render editor for a specific list."""
     st.markdown(f"**{display_name}**")
     
@@ -190,12 +191,9 @@ def _render_list_editor(list_name: str, display_name: str, current_items: List[s
         if bulk_items.strip():
             new_items_list = [item.strip() for item in bulk_items.split('\n') if item.strip()]
             if new_items_list:
-                all_items = current_items + new_items_list
+                all_items = [*current_items, *new_items_list]
                 # Remove duplicates while preserving order
-                unique_items = []
-                for item in all_items:
-                    if item not in unique_items:
-                        unique_items.append(item)
+                unique_items = list(dict.fromkeys(all_items))
                 
                 st.success(f"✅ Added {len(new_items_list)} items to {display_name} (Demo mode)")
                 st.info("In a real implementation, this would update the mapping lists.")
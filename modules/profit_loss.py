@@ -22,36 +22,27 @@ import utils
 import plotly.express as px
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    """Cached helper to load all transactions."""
-    return utils.load_enhanced_transactions()
+def format_accounting(value: float) -> str:
+    """Format numbers in accounting style (with parentheses for negative numbers)."""
+    if value < 0:
+        return f"({abs(value):,.2f})"
+    return f"{value:,.2f}"
+
+
+def _format_dollars(value: float) -> str:
+    return f"${format_accounting(value)}"
 
 
 def render() -> None:
     """Render the profit and loss page."""
     st.title("Profit & Loss")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
     # Sidebar filters
     st.sidebar.markdown("### Filters")
-    # Account filter - extract bank name and last 4 digits from Bank_Account column
-    def extract_account_info(bank_account):
-        """Extract bank name and last 4 digits from Bank_Account column."""
-        if pd.isna(bank_account):
-            return "Unknown Account"
-        # Bank_Account format is like "BOA_7259"
-        parts = str(bank_account).split('_')
-        if len(parts) >= 2:
-            bank_name = parts[0].upper()
-            last4 = parts[1][-4:] if len(parts[1]) >= 4 else parts[1]
-            return f"{bank_name} {last4}"
-        return str(bank_account).upper()
-    
-    # Create account display names
-    df['AccountDisplay'] = df['Bank_Account'].apply(extract_account_info)
+    # Account filter on labels ("BOA 7259") precomputed by the shared loader
     accounts = sorted(df['AccountDisplay'].unique())
     selected_accounts = st.sidebar.multiselect(
         "Select accounts", options=accounts, default=accounts
@@ -71,35 +62,31 @@ def render() -> None:
     if isinstance(start_date, tuple) or isinstance(start_date, list):
         start_date, end_date = start_date  # older versions return tuple
     filtered = filtered[(filtered["Date"] >= pd.to_datetime(start_date)) & (filtered["Date"] <= pd.to_datetime(end_date))]
-    # Create Type column based on Amount (positive = income, negative = expense)
-    filtered['Type'] = filtered['Amount'].apply(lambda x: 'Income' if x > 0 else 'Expense')
-    
-    # Summarise by month
-    summary = (
-        filtered.groupby([filtered["Date"].dt.to_period("M"), "Type"])["Amount"].sum().reset_index()
+    if filtered.empty:
+        st.info("No transactions match the selected filters.")
+        return
+    # Split Amount into income (positive) and expenses (negative) and sum both
+    # per month in one groupby, keyed on integer months since the epoch
+    amount = filtered["Amount"]
+    month_key = filtered["Date"].to_numpy().astype("datetime64[M]").astype("int64")
+    pivot = (
+        pd.DataFrame({"Income": amount.clip(lower=0), "Expenses": amount.clip(upper=0)})
+        .groupby(month_key)[["Income", "Expenses"]]
+        .sum()
+        .rename_axis("Date")
     )
-    summary["Amount"] = summary["Amount"].astype(float)
-    # Pivot to income/expense columns
-    pivot = summary.pivot_table(index="Date", columns="Type", values="Amount", aggfunc="sum").fillna(0)
-    pivot = pivot.rename(columns={"Income": "Income", "Expense": "Expenses"})
-    pivot["Net Income"] = pivot.get("Income", 0) + pivot.get("Expenses", 0)
+    pivot["Net Income"] = pivot["Income"] + pivot["Expenses"]
     pivot = pivot.reset_index()
-    pivot["Date"] = pivot["Date"].dt.to_timestamp()
+    pivot["Date"] = (np.datetime64(0, "M") + pivot["Date"].to_numpy()).astype("datetime64[ns]")
     
     # Format dates to remove time component
     pivot["Period"] = pivot["Date"].dt.strftime("%Y-%m")
     
     # Display metrics
-    total_income = pivot["Income"].sum() if "Income" in pivot else 0
-    total_expenses = -pivot["Expenses"].sum() if "Expenses" in pivot else 0
+    total_income = pivot["Income"].sum()
+    total_expenses = -pivot["Expenses"].sum()
     net_income = total_income - total_expenses
     
-    # Format numbers in accounting style (with parentheses for negative numbers)
-    def format_accounting(value):
-        if value < 0:
-            return f"({abs(value):,.2f})"
-        return f"{value:,.2f}"
-    
     utils.create_metric_row(
         [
             {"label": "Total Income", "value": f"${format_accounting(total_income)}"},
@@ -110,13 +97,11 @@ def render() -> None:
     )
     st.markdown("### Monthly Income & Expenses")
     
-    # Format the display dataframe with accounting style
-    display_df = pivot.copy()
-    display_df["Income"] = display_df["Income"].apply(lambda x: f"${format_accounting(x)}")
-    display_df["Expenses"] = display_df["Expenses"].apply(lambda x: f"${format_accounting(x)}")
-    display_df["Net Income"] = display_df["Net Income"].apply(lambda x: f"${format_accounting(x)}")
-    
-    utils.display_dataframe(display_df[["Period", "Income", "Expenses", "Net Income"]])
+    # Accounting style is applied by a Styler at render time, not on a copy
+    utils.display_dataframe(
+        pivot[["Period", "Income", "Expenses", "Net Income"]],
+        formats={col: _format_dollars for col in ("Income", "Expenses", "Net Income")},
+    )
     # Bar chart
     st.markdown("### Trend")
     try:
@@ -20,44 +20,49 @@ from typing import List
 
 import utils
 
-
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
+# Kept as a pattern string: a compiled re.Pattern would force pandas off the
+# pyarrow regex kernel and back onto per-element Python calls
+_NORM_PATTERN = r"[^A-Z0-9 ]"
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def identify_subscriptions(df: pd.DataFrame, min_occurrences: int = 3) -> pd.DataFrame:
     """Identify recurring expenses by description.
 
     A simple heuristic groups outgoing transactions by normalised
     description and counts how many unique months the transaction
     appears in.  Entries meeting or exceeding ``min_occurrences``
-    are returned as potential subscriptions.
+    are returned as potential subscriptions.  Results are cached on the
+    frame's contents and ``min_occurrences``.
     """
-    subs = []
-    # Filter for expenses (negative amounts) and use Transaction_Description
-    out_df = df[df["Amount"] < 0].copy()
-    if "Transaction_Description" in out_df.columns:
+    # Use Transaction_Description where present
+    if "Transaction_Description" in df.columns:
         desc_col = "Transaction_Description"
     else:
-        # Fallback to any description column
-        desc_col = [col for col in out_df.columns if "description" in col.lower()][0] if any("description" in col.lower() for col in out_df.columns) else "Transaction_Description"
+        # Fallback to the first description column
+        desc_col = next((col for col in df.columns if "description" in col.lower()), "Transaction_Description")
+    
+    # Filter for expenses (negative amounts), taking only the columns needed
+    # instead of copying the whole frame
+    out_df = df.loc[df["Amount"].to_numpy() < 0, [desc_col, "Date", "Amount"]]
     
-    out_df["NormDesc"] = out_df[desc_col].str.upper().str.replace(r"[^A-Z0-9 ]", "", regex=True).str.strip()
-    out_df["Month"] = out_df["Date"].dt.to_period("M")
-    for desc, group in out_df.groupby("NormDesc"):
-        months = group["Month"].nunique()
-        if months >= min_occurrences:
-            total = group["Amount"].sum()
-            avg = group["Amount"].mean()
-            subs.append({"Description": desc.title(), "Months": months, "Total": total, "Average": avg})
-    result = pd.DataFrame(subs).sort_values("Total", ascending=True)
+    # Arrow strings keep upper/replace/strip in pyarrow's compute kernels
+    out_df = out_df.assign(
+        NormDesc=out_df[desc_col].astype("string[pyarrow]").str.upper().str.replace(_NORM_PATTERN, "", regex=True).str.strip(),
+        Month=out_df["Date"].to_numpy().astype("datetime64[M]"),
+    )
+    agg = out_df.groupby("NormDesc", sort=False).agg(
+        Months=("Month", "nunique"), Total=("Amount", "sum"), Average=("Amount", "mean")
+    )
+    result = agg[agg["Months"] >= min_occurrences].reset_index().rename(columns={"NormDesc": "Description"})
+    result["Description"] = result["Description"].str.title()
+    result = result.sort_values("Total", ascending=True)
     return result
 
 
 def render() -> None:
     st.title("Subscription Tracking")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
@@ -67,10 +72,9 @@ def render() -> None:
     if subs_df.empty:
         st.info("No recurring transactions found.")
         return
-    # Format currency
-    subs_df["Total"] = subs_df["Total"].apply(utils.format_currency)
-    subs_df["Average"] = subs_df["Average"].apply(utils.format_currency)
-    utils.display_dataframe(subs_df)
+    # Currency formatting is applied by a Styler at render time, so subs_df
+    # stays numeric for the chart and the exports
+    utils.display_dataframe(subs_df, formats={col: utils.format_currency for col in ("Total", "Average")})
     # Bar chart of average monthly cost per subscription
     try:
         chart_df = subs_df.rename(columns={"Average": "Monthly Cost"})
@@ -81,7 +85,5 @@ def render() -> None:
         st.warning("Unable to display chart. Please check your data.")
         st.info("Chart error details: " + str(e))
     st.markdown("### Export subscriptions")
-    # Convert currency columns back to numeric for export by removing '$' and commas
-    export_df = identify_subscriptions(df, min_occ)
-    utils.add_download_button(export_df, "subscriptions.csv", "Download Subscriptions CSV")
-    utils.add_excel_download_button(export_df, "subscriptions.xlsx", "Download Subscriptions Excel")
\ No newline at end of file
+    utils.add_download_button(subs_df, "subscriptions.csv", "Download Subscriptions CSV")
+    utils.add_excel_download_button(subs_df, "subscriptions.xlsx", "Download Subscriptions Excel")
\ No newline at end of file
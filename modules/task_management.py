@@ -9,8 +9,9 @@ delete completed items.
 
 from __future__ import annotations
 
-import json
 import os
+
+import orjson
 import streamlit as st
 
 from typing import List, Dict
@@ -24,8 +25,8 @@ TASK_FILE = os.path.join("data", "processed", "tasks.json")
 def load_tasks() -> List[Dict[str, any]]:
     if os.path.exists(TASK_FILE):
         try:
-            with open(TASK_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(TASK_FILE, "rb") as f:
+                return orjson.loads(f.read())
         except Exception:
             return []
     return []
@@ -33,8 +34,11 @@ def load_tasks() -> List[Dict[str, any]]:
 
 def save_tasks(tasks: List[Dict[str, any]]) -> None:
     os.makedirs(os.path.dirname(TASK_FILE), exist_ok=True)
-    with open(TASK_FILE, "w", encoding="utf-8") as f:
-        json.dump(tasks, f, indent=2)
+    # Write then rename so a rerun never reads a half-written file
+    tmp_file = TASK_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(tasks, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, TASK_FILE)
 
 
 def render() -> None:
@@ -51,6 +55,8 @@ def render() -> None:
     # Display tasks
     if tasks:
         st.markdown("### Your tasks")
+        # Completion toggles are collected and saved once after the loop
+        dirty = False
         for idx, task in enumerate(tasks):
             cols = st.columns([0.05, 0.8, 0.15])
             with cols[0]:
@@ -65,6 +71,8 @@ def render() -> None:
             # Update completion state
             if done != task["complete"]:
                 task["complete"] = done
-                save_tasks(tasks)
+                dirty = True
+        if dirty:
+            save_tasks(tasks)
     else:
         st.info("No tasks.  Add one using the form above.")
\ No newline at end of file
@@ -22,11 +22,6 @@ import plotly.express as px
 import utils
 
 
-@st.cache_data(ttl=3600)  # 1 hour cache
-def get_data() -> pd.DataFrame:
-    return utils.load_enhanced_transactions()
-
-
 def compute_metrics_over_time(df: pd.DataFrame, period: str) -> pd.DataFrame:
     """Compute various financial metrics over time.
 
@@ -42,35 +37,32 @@ def compute_metrics_over_time(df: pd.DataFrame, period: str) -> pd.DataFrame:
     pd.DataFrame
         DataFrame indexed by timestamp with columns for each metric.
     """
+    # Floor dates with numpy datetime casts rather than building Periods
+    dates = df["Date"].to_numpy().astype("datetime64[ns]")
     if period == "Daily":
-        period_index = df["Date"].dt.floor("D")
+        period_index = dates.astype("datetime64[D]")
     elif period == "Monthly":
-        period_index = df["Date"].dt.to_period("M").dt.to_timestamp()
+        period_index = dates.astype("datetime64[M]")
     else:
-        period_index = df["Date"].dt.to_period("Q").dt.to_timestamp()
+        # Months since the epoch are quarter-aligned, so step back to the quarter start
+        months = dates.astype("datetime64[M]")
+        period_index = months - (months.astype("int64") % 3).astype("timedelta64[M]")
     
     # Create base DataFrame with available columns
     metrics_df = pd.DataFrame({
-        "Period": period_index, 
-        "Amount": df["Amount"], 
-        "Bank_Account": df["Bank_Account"]
+        "Period": pd.Series(period_index.astype("datetime64[ns]"), index=df.index),
+        "Amount": df["Amount"],
     })
     
-    # Derive Type from Amount (positive = income, negative = expense)
-    metrics_df["Type"] = metrics_df["Amount"].apply(lambda x: "Income" if x > 0 else "Expense")
-    
-    # Income, expenses and net income
-    income_df = metrics_df[metrics_df["Type"] == "Income"].groupby("Period")["Amount"].sum()
-    expense_df = metrics_df[metrics_df["Type"] == "Expense"].groupby("Period")["Amount"].sum()
-    
-    # Calculate running balances by account
-    balances = metrics_df.groupby(["Period", "Bank_Account"])["Amount"].sum().unstack().fillna(0)
-    
-    # Calculate cumulative balances
-    cumulative_balances = balances.cumsum()
+    # Income, expenses and net income (positive = income, otherwise expense)
+    is_income = metrics_df["Amount"].to_numpy() > 0
+    income_df = metrics_df.loc[is_income].groupby("Period")["Amount"].sum()
+    expense_df = metrics_df.loc[~is_income].groupby("Period")["Amount"].sum()
     
-    # Summarise cash (all accounts)
-    cash = cumulative_balances.sum(axis=1)
+    # Cash across all accounts is the running total of per-period sums;
+    # rows without a Bank_Account belong to no account balance
+    has_account = df["Bank_Account"].notna().to_numpy()
+    cash = metrics_df.loc[has_account].groupby("Period")["Amount"].sum().cumsum()
     
     # For demo purposes, assume all accounts are assets (no credit cards in sample data)
     assets = cash
@@ -88,13 +80,13 @@ def compute_metrics_over_time(df: pd.DataFrame, period: str) -> pd.DataFrame:
     result["Total Income"] = income_df
     result["Total Expenses"] = -expense_df  # expenses stored as negative amounts, so invert sign
     result["Net Income"] = result["Total Income"].fillna(0) - result["Total Expenses"].fillna(0)
-    result = result.fillna(method="ffill").fillna(0)
+    result = result.ffill().fillna(0)
     return result.reset_index()
 
 
 def render() -> None:
     st.title("Time Series Analysis")
-    df = get_data()
+    df = utils.load_enhanced_transactions()
     if df.empty:
         st.info("No transaction data found.  Please add files to the data directory and reload.")
         return
@@ -8,41 +8,72 @@ and assign values using dropdown menus.
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import os
 import json
 
+import utils
+
+
+@st.cache_data(show_spinner=False)
+def _summarise_transactions(path: str, mtime_ns: int) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Build the recent transactions, category and tag tables shown on the page.
+
+    ``path`` and ``mtime_ns`` only key the cache; the frame itself comes from
+    the shared :func:`utils.load_enhanced_transactions` cache.
+    """
+    df = utils.load_enhanced_transactions()
+    recent_transactions = df.nlargest(20, 'Date')[
+        ['Date', 'Description', 'Amount', 'Category1', 'Category2', 'Tags', 'Payer', 'Payee']
+    ]
+    
+    category_summary = df.groupby('Category1', observed=True, sort=False)['Amount'].agg(['sum', 'count']).reset_index()
+    category_summary.columns = ['Category', 'Total Amount', 'Transaction Count']
+    category_summary = category_summary.sort_values('Total Amount', ascending=False)
+    
+    tag_summary = df.groupby('Tags', observed=True, sort=False)['Amount'].agg(['sum', 'count']).reset_index()
+    tag_summary.columns = ['Tags', 'Total Amount', 'Transaction Count']
+    tag_summary = tag_summary.sort_values('Total Amount', ascending=False)
+    return recent_transactions, category_summary, tag_summary
+
 
 def render() -> None:
     """Render the transaction mapping interface."""
     st.title("Transaction Mapping")
     st.markdown("Map unmapped transactions to categories, tags, and other metadata.")
     
-    # Load enhanced transaction data
-    enhanced_file = os.path.join("data", "processed", "transactions_combined_enhanced.csv")
+    # Load enhanced transaction data from the file the processor writes
+    enhanced_file = utils.enhanced_transactions_file()
     
-    if not os.path.exists(enhanced_file):
+    if enhanced_file is None:
         st.error("Enhanced transaction file not found. Please ensure the data processing workflow has been run.")
         return
     
-    # Load transaction data
+    # The parsed frame and summary tables are cached until the file's
+    # modification time changes
+    mtime_ns = os.stat(enhanced_file).st_mtime_ns
     with st.spinner("Loading transaction data..."):
-        df = pd.read_csv(enhanced_file)
-        df['Date'] = pd.to_datetime(df['Date'])
+        df = utils.load_enhanced_transactions()
+        if df.empty:
+            return
+        recent_transactions, category_summary, tag_summary = _summarise_transactions(enhanced_file, mtime_ns)
     
     # For demo purposes, show all transactions since we have sample data
     st.info("📊 Sample data loaded successfully! All transactions are pre-mapped for demonstration.")
     
-    # Show transaction summary
+    # Show transaction summary, splitting the Amount buffer once
+    amount = df['Amount'].to_numpy()
+    total_income = amount[amount > 0].sum()
+    total_expenses = amount[amount < 0].sum()
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Transactions", len(df))
+        st.metric("Total Transactions", amount.size)
     with col2:
-        st.metric("Total Income", f"${df[df['Amount'] > 0]['Amount'].sum():,.2f}")
+        st.metric("Total Income", f"${total_income:,.2f}")
     with col3:
-        st.metric("Total Expenses", f"${abs(df[df['Amount'] < 0]['Amount'].sum()):,.2f}")
+        st.metric("Total Expenses", f"${abs(total_expenses):,.2f}")
     with col4:
-        st.metric("Net Cash Flow", f"${df['Amount'].sum():,.2f}")
+        st.metric("Net Cash Flow", f"${total_income + total_expenses:,.2f}")
     
     st.markdown("---")
     
@@ -51,11 +82,7 @@ def render() -> None:
     st.markdown("This shows a sample of the enhanced transaction data with all mappings applied:")
     
     # Show recent transactions
-    recent_transactions = df.sort_values('Date', ascending=False).head(20)
-    st.dataframe(
-        recent_transactions[['Date', 'Description', 'Amount', 'Category1', 'Category2', 'Tags', 'Payer', 'Payee']],
-        use_container_width=True
-    )
+    st.dataframe(recent_transactions, use_container_width=True)
     
     st.markdown("---")
     
@@ -75,18 +102,10 @@ def render() -> None:
     
     # Show category breakdown
     st.subheader("Category Breakdown")
-    category_summary = df.groupby('Category1')['Amount'].agg(['sum', 'count']).reset_index()
-    category_summary.columns = ['Category', 'Total Amount', 'Transaction Count']
-    category_summary = category_summary.sort_values('Total Amount', ascending=False)
-    
     st.dataframe(category_summary, use_container_width=True)
     
     # Show tag breakdown
     st.subheader("Tag Analysis")
-    tag_summary = df.groupby('Tags')['Amount'].agg(['sum', 'count']).reset_index()
-    tag_summary.columns = ['Tags', 'Total Amount', 'Transaction Count']
-    tag_summary = tag_summary.sort_values('Total Amount', ascending=False)
-    
     st.dataframe(tag_summary, use_container_width=True)
     
     st.markdown("---")
@@ -20,8 +20,12 @@ NOTES_DIR = os.path.join("data", "processed", "notes")
 os.makedirs(NOTES_DIR, exist_ok=True)
 
 
+# Short TTL so files added outside the app still show up; the app's own
+# writes clear the cache directly
+@st.cache_data(ttl=5, show_spinner=False)
 def list_notes() -> list[str]:
-    return [f for f in os.listdir(NOTES_DIR) if f.endswith(".md")]
+    with os.scandir(NOTES_DIR) as entries:
+        return [entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file()]
 
 
 def load_note(name: str) -> str:
@@ -32,10 +36,12 @@ def load_note(name: str) -> str:
 def save_note(name: str, content: str) -> None:
     with open(os.path.join(NOTES_DIR, name), "w", encoding="utf-8") as f:
         f.write(content)
+    list_notes.clear()
 
 
 def delete_note(name: str) -> None:
     os.remove(os.path.join(NOTES_DIR, name))
+    list_notes.clear()
 
 
 def render() -> None:
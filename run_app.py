@@ -16,9 +16,20 @@ def main():
     # Change to the script directory
     os.chdir(script_dir)
     
-    # Run streamlit
+    command = [sys.executable, "-m", "streamlit", "run", "app.py"]
+    
+    if os.name != "nt":
+        # Replace this process with streamlit so no parent interpreter stays
+        # resident and signals reach streamlit directly
+        try:
+            os.execv(sys.executable, command)
+        except OSError as e:
+            print(f"Error running Streamlit: {e}")
+            sys.exit(1)
+    
+    # Windows has no true exec, so run streamlit as a child process
     try:
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "app.py"], check=True)
+        subprocess.run(command, check=True)
     except KeyboardInterrupt:
         print("\nApplication stopped by user.")
     except subprocess.CalledProcessError as e:
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Create the default streamlit-authenticator configuration.
+
+Run this once before starting the application with ``auth_new``.  It
+writes ``data/auth_config.json`` if the file does not already exist,
+converting an ``auth_config.yaml`` from earlier versions or else adding
+a demo user.
+"""
+
+import os
+import sys
+
+# Run from the project root so relative data paths resolve as in the app
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(PROJECT_ROOT)
+sys.path.insert(0, PROJECT_ROOT)
+
+import auth_new  # noqa: E402
+
+
+def main():
+    """Write the default auth configuration if it is missing."""
+    if auth_new.bootstrap_config_if_missing():
+        print(f"Created {auth_new.CONFIG_FILE}")
+    else:
+        print(f"{auth_new.CONFIG_FILE} already exists; nothing to do.")
+
+
+if __name__ == "__main__":
+    main()
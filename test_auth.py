@@ -1,27 +1,101 @@
 import hashlib
+import hmac
 import json
 
+import pytest
+
+from auth import AuthManager
+
 def test_password():
     # Test the password hash
     password = "test1pw"
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
-    
-    print(f"Password: {password}")
-    print(f"Generated Hash: {password_hash}")
     
     # Load the users file
     with open("data/users.json", "r") as f:
         users = json.load(f)
+    user = users["user1"]
+    
+    if "password_salt" in user:
+        # Same scrypt parameters as AuthManager._hash_password
+        digest = hashlib.scrypt(
+            password.encode("utf-8"), salt=bytes.fromhex(user["password_salt"]), n=2**14, r=8, p=1, dklen=32
+        )
+    else:
+        # Legacy records hold an unsalted SHA-256 digest until the next login upgrades them
+        digest = hashlib.sha256(password.encode("utf-8")).digest()
+    
+    print(f"Password: {password}")
+    print(f"Generated Hash: {digest.hex()}")
     
-    stored_hash = users["user1"]["password_hash"]
+    stored_hash = user["password_hash"]
     print(f"Stored Hash: {stored_hash}")
     
-    # Check if they match
-    if password_hash == stored_hash:
+    # Compare the binary digests in constant time
+    if hmac.compare_digest(digest, bytes.fromhex(stored_hash)):
         print("✅ Password hash matches! Authentication should work.")
     else:
         print("❌ Password hash mismatch! This is why login isn't working.")
-        print(f"Difference: {password_hash != stored_hash}")
+        print(f"Difference: {digest.hex() != stored_hash}")
+
+def test_legacy_sha256_password_upgrades_to_scrypt(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    legacy = {"password_hash": hashlib.sha256(b"legacy-pw").hexdigest(), "email": "old@example.com", "role": "user"}
+    (tmp_path / "data" / "users.json").write_text(json.dumps({"olduser": legacy}))
+    manager = AuthManager()
+
+    assert manager.login_user("olduser", "wrong") is None
+    assert manager.login_user("olduser", "legacy-pw") is not None
+
+    with open("data/users.json") as f:
+        user = json.load(f)["olduser"]
+    expected = hashlib.scrypt(
+        b"legacy-pw", salt=bytes.fromhex(user["password_salt"]), n=2**14, r=8, p=1, dklen=32
+    )
+    assert hmac.compare_digest(expected, bytes.fromhex(user["password_hash"]))
+    assert user["email"] == "old@example.com"
+    # The upgraded record keeps working, from a fresh manager too
+    assert AuthManager().login_user("olduser", "legacy-pw") is not None
+
+
+def test_logout_invalidates_session_for_every_manager(tmp_path, monkeypatch):
+    # AuthManager keeps its files under ./data
+    monkeypatch.chdir(tmp_path)
+    first = AuthManager()
+    second = AuthManager()
+    token = first.login_user("user1", "test1pw")
+    assert first.validate_session(token) == "user1"
+    assert second.validate_session(token) == "user1"
+
+    # Another worker process or a rebuilt manager must not keep trusting the token
+    first.logout_user(token)
+    assert first.validate_session(token) is None
+    assert second.validate_session(token) is None
+    assert AuthManager().validate_session(token) is None
+
+
+def test_failed_save_leaves_cached_users_untouched(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = AuthManager()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    # A write that never lands must not show up in the cache
+    with monkeypatch.context() as patched:
+        patched.setattr("auth.os.replace", fail_replace)
+        with pytest.raises(OSError):
+            manager.register_user("newuser", "newuser-pw", "new@example.com")
+        with pytest.raises(OSError):
+            manager.change_password("user1", "test1pw", "changed-pw")
+    assert manager.get_user_info("newuser") is None
+    assert manager.login_user("user1", "test1pw") is not None
+
+    assert manager.register_user("newuser", "newuser-pw", "new@example.com")
+    info = manager.get_user_info("newuser")
+    info["role"] = "admin"
+    assert manager.get_user_info("newuser")["role"] == "user"
+
 
 if __name__ == "__main__":
     test_password()
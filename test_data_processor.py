@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+import config
+import utils
+from data_processor import DataProcessor, MAPPING_COLUMNS
+
+
+RAW_FILE = "transaction-raw-import-chase_chk_1234-2024.01.01-2024.03.31.csv"
+
+
+def _mapping(category, payee):
+    return {
+        "account_type": "expense",
+        "category1": category,
+        "category2": None,
+        "category3": None,
+        "tags": ["monthly"],
+        "payer": "Self",
+        "payee": payee,
+    }
+
+
+def test_update_mapping_matches_full_reprocess(tmp_path, monkeypatch):
+    # DataProcessor keeps its files under ./data; the raw reader follows config
+    monkeypatch.chdir(tmp_path)
+    raw = tmp_path / "data" / "raw"
+    raw.mkdir(parents=True)
+    monkeypatch.setattr(config.config, "data_raw_dir", str(raw))
+    monkeypatch.setattr(config.config, "data_processed_dir", str(tmp_path / "data" / "processed"))
+    utils._combine_transaction_files.clear()
+    (raw / RAW_FILE).write_text(
+        "Date,Description,Amount\n"
+        "01/02/2024,NETFLIX,$-15.49\n"
+        "01/03/2024,Coffee Shop,$-4.50\n"
+        "01/04/2024,COFFEE SHOP #12,$-5.25\n"
+        "01/05/2024,coffee shop,$-3.75\n"
+        "02/02/2024,Netflix.com,$-15.49\n"
+        "02/03/2024,Corner Bakery,$-8.10\n"
+        "02/04/2024,PAYROLL,\"$1,200.00\"\n"
+    )
+
+    processor = DataProcessor()
+    processor.mappings["mappings"]["NETFLIX"] = _mapping("Entertainment", "Netflix")
+    processor.process_all_files()
+
+    processor.update_mapping("Coffee Shop", _mapping("Food & Dining", "Cafe"))
+    incremental = pd.read_parquet(processor.combined_file)
+
+    # A new processor reloads the saved mappings and rebuilds everything
+    utils._combine_transaction_files.clear()
+    full = DataProcessor().process_all_files()
+
+    columns = ["Date", "Description", "Amount", "MappedDescription", *MAPPING_COLUMNS.values()]
+
+    def normalise(df):
+        df = df[columns].sort_values(["Date", "Description"]).reset_index(drop=True)
+        df["Tags"] = df["Tags"].map(lambda tags: list(tags) if isinstance(tags, (list, tuple, np.ndarray)) else None)
+        return df.astype(object).where(df.notna(), None)
+
+    pd.testing.assert_frame_equal(normalise(incremental), normalise(full))
+    coffee = normalise(full).set_index("Description")
+    assert coffee.loc["coffee shop", "Category1"] == "Food & Dining"
+    assert coffee.loc["Netflix.com", "Payee"] == "Netflix"
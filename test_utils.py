@@ -0,0 +1,128 @@
+import io
+import os
+from datetime import date
+
+import openpyxl
+import pandas as pd
+import pytest
+
+import config
+import utils
+
+
+CHASE_FILE = "transaction-raw-import-chase_chk_1234-2024.01.01-2024.06.30.csv"
+EMPTY_FILE = "transaction-raw-import-boa_chk_7259-2024.01.01-2024.01.31.csv"
+
+
+@pytest.fixture
+def raw_dir(tmp_path, monkeypatch):
+    """Point the configured data directories at a temporary tree."""
+    raw = tmp_path / "raw"
+    processed = tmp_path / "processed"
+    raw.mkdir()
+    processed.mkdir()
+    monkeypatch.setattr(config.config, "data_raw_dir", str(raw))
+    monkeypatch.setattr(config.config, "data_processed_dir", str(processed))
+    utils._combine_transaction_files.clear()
+    yield raw
+    utils._combine_transaction_files.clear()
+
+
+def _write_chase(raw_dir):
+    (raw_dir / CHASE_FILE).write_text(
+        "Date,Description,Amount,Running Bal.\n"
+        "01/02/2024,NETFLIX,\"$-15.49\",984.51\n"
+        "01/05/2024,PAYROLL,\"$1,200.00\",2184.51\n"
+        "\n"
+        "02/02/2024,NETFLIX,$-15.49,2169.02\n"
+    )
+
+
+def test_load_all_transactions_through_parse_cache(raw_dir):
+    _write_chase(raw_dir)
+    (raw_dir / EMPTY_FILE).write_text("Date,Description,Amount\n")
+
+    # The first load parses the files, the second reads them from the Parquet cache
+    first = utils.load_all_transactions()
+    utils._combine_transaction_files.clear()
+    second = utils.load_all_transactions()
+
+    cache_dir = os.path.join(config.config.data_processed_dir, ".cache")
+    assert len(os.listdir(cache_dir)) == 2
+    pd.testing.assert_frame_equal(first, second)
+    assert len(second) == 3
+    assert second["Amount"].tolist() == [-15.49, 1200.0, -15.49]
+    assert second["Type"].tolist() == ["Outgoing", "Incoming", "Outgoing"]
+    assert list(second["Bank"].cat.categories) == ["chase"]
+    assert second["PeriodMonth"].astype(str).tolist() == ["2024-01", "2024-01", "2024-02"]
+
+
+def test_load_all_transactions_picks_up_changed_file(raw_dir):
+    _write_chase(raw_dir)
+    assert len(utils.load_all_transactions()) == 3
+
+    path = raw_dir / CHASE_FILE
+    path.write_text(path.read_text() + "03/01/2024,GYM,$-40.00,2129.02\n")
+    # Force a different mtime even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert len(utils.load_all_transactions()) == 4
+
+
+def test_fill_running_balance_matches_groupby_cumsum():
+    df = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-01", "2024-01-02"]),
+            "Amount": [5.0, 10.0, float("nan"), -2.0, -3.0],
+            "RunningBalance": [float("nan")] * 4 + [100.0],
+            "Bank": pd.Categorical(["a", "a", "a", "b", "b"]),
+            "AccountLast4": pd.Categorical(["1", "1", "1", "1", "1"]),
+        }
+    )
+    utils._fill_running_balance(df)
+    assert df["RunningBalance"].tolist()[:2] == [15.0, 10.0]
+    assert pd.isna(df["RunningBalance"].iloc[2])
+    assert df["RunningBalance"].tolist()[3:] == [-2.0, 100.0]
+
+
+def _sheet_cells(payload):
+    sheet = openpyxl.load_workbook(io.BytesIO(payload))["Data"]
+    return [
+        [(cell.value, cell.number_format, cell.font.b, cell.border.top.style) for cell in row]
+        for row in sheet.iter_rows()
+    ]
+
+
+def _to_excel_bytes(df):
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name="Data")
+    return buffer.getvalue()
+
+
+def test_streamed_excel_matches_to_excel():
+    df = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(["2024-01-02 10:30", None, "2024-03-04 00:00"]),
+            "Amount": [1.5, float("nan"), float("-inf")],
+            "Count": [1, 2, 3],
+            "Flag": [True, False, True],
+            "Description": pd.array(["a", None, "=text"], dtype="string"),
+            "Total": pd.array([1, None, 3], dtype="Int64"),
+        }
+    )
+    assert utils._can_stream_to_excel(df)
+    assert _sheet_cells(utils._excel_bytes(df)) == _sheet_cells(_to_excel_bytes(df))
+
+
+def test_excel_falls_back_to_to_excel_for_other_types():
+    df = pd.DataFrame(
+        {
+            "Period": pd.period_range("2024-01", periods=2, freq="M"),
+            "Day": [date(2024, 1, 1), date(2024, 1, 2)],
+            "Category": pd.Categorical(["x", "y"]),
+        }
+    )
+    assert not utils._can_stream_to_excel(df)
+    assert _sheet_cells(utils._excel_bytes(df)) == _sheet_cells(_to_excel_bytes(df))
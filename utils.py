@@ -10,21 +10,44 @@ modules.
 
 from __future__ import annotations
 
+import hashlib
 import io
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 import streamlit as st
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as pa_feather
+import xlsxwriter
 
 import config
 from config import get_chart_config, get_table_config
 
 
+# ``[bank]_[accountType]_[last4]`` section of a raw transaction filename
+_BANK_PART_PATTERN = re.compile(r"([^_]+)_([^_]+)_(\d{4})", re.ASCII)
+
+# ``YYYY.MM.DD`` as used in raw transaction filenames
+_FILENAME_DATE_PATTERN = re.compile(r"(\d{4})\.(\d{1,2})\.(\d{1,2})", re.ASCII)
+
+
+def _filename_date(text: str) -> datetime:
+    """Parse a ``YYYY.MM.DD`` filename date without going through strptime."""
+    match = _FILENAME_DATE_PATTERN.fullmatch(text)
+    if match is None:
+        raise ValueError(f"invalid filename date: {text!r}")
+    year, month, day = match.groups()
+    return datetime(int(year), int(month), int(day))
+
+
 def parse_transaction_filename(filename: str) -> Tuple[str, str, str, str, Tuple[datetime, datetime]]:
     """Parse the standardised transaction filename into its components.
 
@@ -51,20 +74,133 @@ def parse_transaction_filename(filename: str) -> Tuple[str, str, str, str, Tuple
     parts = name.split("-")
     # Expected structure: ['transactions', 'raw', 'import', '[bank]_[type]_[last4]', 'YYYY.MM.DD', 'YYYY.MM.DD']
     bank_part = parts[3]
-    bank_match = re.match(r"(?P<bank>[^_]+)_(?P<acct_type>[^_]+)_(?P<last4>\d{4})", bank_part)
-    bank = bank_match.group("bank") if bank_match else "unknown"
-    acct_type = bank_match.group("acct_type") if bank_match else "unknown"
-    last4 = bank_match.group("last4") if bank_match else "0000"
+    bank_match = _BANK_PART_PATTERN.match(bank_part)
+    if bank_match:
+        bank, acct_type, last4 = bank_match.groups()
+    else:
+        bank, acct_type, last4 = "unknown", "unknown", "0000"
     try:
-        start_date = datetime.strptime(parts[4], "%Y.%m.%d")
-        end_date = datetime.strptime(parts[5], "%Y.%m.%d")
+        start_date = _filename_date(parts[4])
+        end_date = _filename_date(parts[5])
     except Exception:
         start_date = None
         end_date = None
     return bank, acct_type, last4, ext.lstrip("."), (start_date, end_date)
 
 
+def _read_csv(path: str, encoding: Optional[str] = None) -> pd.DataFrame:
+    """Read a CSV with the multithreaded Arrow reader, dropping blank rows.
+
+    Files the Arrow reader rejects (such as ragged rows) or only reads as
+    binary because the text does not decode are re-read with the chunked
+    C-engine reader, which raises ``UnicodeDecodeError`` where appropriate.
+    """
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(encoding=encoding or "utf8"),
+            # Treat empty text fields as missing, as pandas does
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return _read_csv_chunked(path, encoding=encoding)
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        return _read_csv_chunked(path, encoding=encoding)
+    # Arrow infers ISO dates itself; keep them as text like the C engine so
+    # columns from different files still combine (Date is parsed later)
+    schema = pa.schema(
+        [pa.field(field.name, pa.string()) if pa.types.is_temporal(field.type) else field for field in table.schema]
+    )
+    return table.cast(schema).to_pandas().dropna(how="all").reset_index(drop=True)
+
+
+def _read_csv_chunked(path: str, encoding: Optional[str] = None, chunksize: int = 100_000) -> pd.DataFrame:
+    """Read a CSV in chunks, dropping blank rows before they are combined."""
+    chunks = [
+        chunk.dropna(how="all")
+        for chunk in pd.read_csv(path, encoding=encoding, chunksize=chunksize)
+    ]
+    return pd.concat(chunks, ignore_index=True)
+
+
+# Bump when the parsing below changes so stale cached frames are ignored
+_PARSE_CACHE_VERSION = 7
+
+# Statement summary lines sit above the header; it is searched for in this many rows
+_EXCEL_HEADER_SCAN_ROWS = 20
+
+# Kept as a pattern string so pandas runs it in pyarrow's regex kernel
+_AMOUNT_STRIP_PATTERN = r"[,$\s]"
+
+
+# Per-file metadata columns added by the parser, stored as categoricals
+_SOURCE_COLUMNS = ("Bank", "AccountType", "AccountLast4", "FileName")
+
+# Date formats seen in bank exports, tried in order against a sample of values
+_DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%Y/%m/%d", "%d/%m/%Y")
+
+
+def _detect_date_format(values: pd.Series) -> Optional[str]:
+    """Return the first of ``_DATE_FORMATS`` that parses a sample of ``values``.
+
+    ``None`` lets :func:`pandas.to_datetime` infer the format itself.
+    """
+    sample = values.dropna().astype(str).head(5)
+    if sample.empty:
+        return None
+    for date_format in _DATE_FORMATS:
+        if pd.to_datetime(sample, format=date_format, errors="coerce").notna().all():
+            return date_format
+    return None
+
+
+def _parse_cache_path(path: str) -> Tuple[str, str]:
+    """Return the cache directory and file for ``path``'s current contents.
+
+    Entries are named ``<path hash>-<contents hash>.parquet``, where the
+    contents hash covers the file's mtime and size, so a changed source
+    file misses the cache and older entries can be found by prefix.
+    """
+    stat = os.stat(path)
+    cache_dir = os.path.join(config.config.data_processed_dir, ".cache")
+    path_key = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+    contents_key = hashlib.blake2b(
+        f"{stat.st_mtime_ns}|{stat.st_size}|{_PARSE_CACHE_VERSION}".encode(), digest_size=8
+    ).hexdigest()
+    return cache_dir, os.path.join(cache_dir, f"{path_key}-{contents_key}.parquet")
+
+
 def read_transaction_file(path: str) -> pd.DataFrame:
+    """Read a single transaction file, reusing its cached parse when unchanged.
+
+    Cleaned frames are cached as Parquet under
+    ``config.data_processed_dir/.cache`` so an unchanged file skips the
+    Excel/CSV parse and the cleaning steps.  Frames Arrow cannot store,
+    such as columns mixing text and numbers, are simply not cached.  See
+    :func:`_parse_transaction_file` for the parsing itself.
+    """
+    cache_dir, cache_file = _parse_cache_path(path)
+    if os.path.exists(cache_file):
+        try:
+            return pd.read_parquet(cache_file, engine="pyarrow")
+        except Exception:
+            pass
+    df = _parse_transaction_file(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Drop entries for older versions of this file before writing the new one
+        prefix = os.path.basename(cache_file).split("-")[0] + "-"
+        for entry in os.scandir(cache_dir):
+            if entry.name.startswith(prefix):
+                os.remove(entry.path)
+        df.to_parquet(cache_file, engine="pyarrow", compression="zstd", index=False)
+    except (OSError, pa.ArrowException):
+        if os.path.exists(cache_file):
+            os.remove(cache_file)
+    return df
+
+
+def _parse_transaction_file(path: str) -> pd.DataFrame:
     """Read a single transaction file and return a cleaned DataFrame.
 
     This function automatically detects whether the input is a CSV or an
@@ -105,67 +241,62 @@ def read_transaction_file(path: str) -> pd.DataFrame:
     # Attempt to read accordingly
     if is_excel:
         xls = pd.ExcelFile(path)
-        df = pd.read_excel(xls, sheet_name=0, header=None)
-        # Identify header row by scanning for 'Date' and 'Amount'
-        header_idx = None
-        for i, row in df.iterrows():
-            row_strs = row.astype(str).str.lower().tolist()
-            if "date" in row_strs and "amount" in row_strs:
-                header_idx = i
-                break
-        if header_idx is None:
-            # Fallback: treat first row as header
-            header_idx = 0
-        df.columns = df.iloc[header_idx].astype(str)
-        df = df.iloc[header_idx + 1 :].reset_index(drop=True)
+        # Identify header row by scanning the first rows for 'Date' and 'Amount'
+        peek = pd.read_excel(xls, sheet_name=0, header=None, nrows=_EXCEL_HEADER_SCAN_ROWS)
+        cells = np.char.lower(peek.to_numpy(dtype=str))
+        is_header = (cells == "date").any(axis=1) & (cells == "amount").any(axis=1)
+        # Fallback: treat first row as header
+        header_idx = int(is_header.argmax()) if is_header.any() else 0
+        df = pd.read_excel(xls, sheet_name=0, header=header_idx)
+        # Drop completely blank rows (the CSV reader drops them per chunk)
+        df = df.dropna(how="all").reset_index(drop=True)
     else:
         # Assume CSV file; attempt reading with utf‑8 first, then latin1
         try:
-            df = pd.read_csv(path)
+            df = _read_csv(path)
         except UnicodeDecodeError:
-            df = pd.read_csv(path, encoding="latin1")
-    # Drop completely blank rows
-    df = df.dropna(how="all").copy()
+            df = _read_csv(path, encoding="latin1")
     # Standardise column names
     df.columns = [str(c).strip() for c in df.columns]
-    # Add account metadata
-    df["Bank"] = bank
-    df["AccountType"] = acct_type
-    df["AccountLast4"] = last4
-    df["FileName"] = fname
+    # Add account metadata as single-category columns (one code per row)
+    codes = np.zeros(len(df), dtype=np.int8)
+    for column, value in zip(_SOURCE_COLUMNS, (bank, acct_type, last4, fname)):
+        df[column] = pd.Categorical.from_codes(codes, categories=[value])
+    # Standard column names are collected and applied in a single rename
+    renames: Dict[str, str] = {}
     # Convert Date column to datetime if present
     date_cols = [c for c in df.columns if c.lower().startswith("date")]
     if date_cols:
         date_col = date_cols[0]
-        df[date_col] = pd.to_datetime(df[date_col], errors="coerce").dt.date
-        df = df.rename(columns={date_col: "Date"})
+        # Parse with an explicit format where one fits, and keep datetime64
+        # (times dropped) rather than boxing every value as a ``date``
+        date_format = None if pd.api.types.is_datetime64_any_dtype(df[date_col]) else _detect_date_format(df[date_col])
+        df[date_col] = pd.to_datetime(df[date_col], format=date_format, errors="coerce", cache=True).dt.normalize()
+        renames[date_col] = "Date"
     # Ensure Amount column numeric
     amt_cols = [c for c in df.columns if "amount" in c.lower()]
     if amt_cols:
         amt_col = amt_cols[0]
-        df[amt_col] = (
-            df[amt_col]
-            .astype(str)
-            .str.replace(",", "", regex=False)
-            .str.replace("$", "", regex=False)
-            .astype(float)
-        )
-        df = df.rename(columns={amt_col: "Amount"})
+        # One regex pass over Arrow strings strips separators, "$" and spaces
+        df[amt_col] = pd.to_numeric(
+            df[amt_col].astype("string[pyarrow]").str.replace(_AMOUNT_STRIP_PATTERN, "", regex=True),
+            errors="coerce",
+        ).astype("float64")
+        renames[amt_col] = "Amount"
     # Running balance may have multiple names
     bal_cols = [c for c in df.columns if "running" in c.lower() and "bal" in c.lower()]
     if bal_cols:
-        bal_col = bal_cols[0]
-        df = df.rename(columns={bal_col: "RunningBalance"})
+        renames[bal_cols[0]] = "RunningBalance"
     else:
-        # No running balance; compute cumulative sum for account as approximate
+        # No running balance; filled per account once all files are combined
         df["RunningBalance"] = np.nan
     # Description column
     desc_cols = [c for c in df.columns if "description" in c.lower()]
     if desc_cols:
-        desc_col = desc_cols[0]
-        df = df.rename(columns={desc_col: "Description"})
+        renames[desc_cols[0]] = "Description"
     else:
         df["Description"] = ""
+    df = df.rename(columns=renames)
     return df
 
 
@@ -177,7 +308,8 @@ def load_all_transactions() -> pd.DataFrame:
     transactions with additional metadata columns.  After loading the
     combined dataset, basic derived fields such as ``Type`` (incoming
     vs outgoing), ``PeriodMonth``, ``PeriodQuarter`` and ``PeriodYear``
-    are added.
+    are added.  The combined frame is cached until a file is added,
+    removed or modified.
 
     Returns
     -------
@@ -189,53 +321,185 @@ def load_all_transactions() -> pd.DataFrame:
         for f in files:
             if not f.startswith("."):
                 all_files.append(os.path.join(root, f))
+    if not all_files:
+        return pd.DataFrame()
+    # Any added, removed or rewritten file changes the key and re-parses
+    stats = [os.stat(path) for path in all_files]
+    fingerprint = tuple(
+        (path, stat.st_mtime_ns, stat.st_size) for path, stat in zip(all_files, stats)
+    )
+    return _combine_transaction_files(fingerprint)
+
+
+def _concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Stack ``frames`` by name, aligning their columns in one Arrow pass.
+
+    Frames Arrow cannot convert, such as object columns with mixed types,
+    fall back to ``pd.concat``.
+    """
+    try:
+        tables = [pa.Table.from_pandas(frame, preserve_index=False) for frame in frames]
+        combined = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pd.concat(frames, ignore_index=True)
+    return combined.to_pandas(self_destruct=True)
+
+
+@st.cache_data(ttl=3600, show_spinner="Loading transactions…")
+def _combine_transaction_files(fingerprint: Tuple[Tuple[str, int, int], ...]) -> pd.DataFrame:
+    """Parse and combine the files in ``fingerprint`` (path, mtime, size)."""
+    all_files = [path for path, _, _ in fingerprint]
     data_frames: List[pd.DataFrame] = []
-    for path in all_files:
-        try:
-            df = read_transaction_file(path)
-        except Exception as e:
-            st.warning(f"Failed to read {os.path.basename(path)}: {e}")
-            continue
-        data_frames.append(df)
+    # The parsers release the GIL, so files are read concurrently; results
+    # are collected in file order and warnings raised from this thread
+    with ThreadPoolExecutor(max_workers=min(len(all_files), os.cpu_count() or 1)) as executor:
+        futures = [(path, executor.submit(read_transaction_file, path)) for path in all_files]
+        for path, future in futures:
+            error = future.exception()
+            if error is not None:
+                st.warning(f"Failed to read {os.path.basename(path)}: {error}")
+                continue
+            data_frames.append(future.result())
     if not data_frames:
         return pd.DataFrame()
-    combined = pd.concat(data_frames, ignore_index=True)
+    combined = _concat_frames(data_frames)
+    # Re-merge the categories sorted (the pd.concat fallback leaves strings).
+    # Header-only files add no rows and lose their category in the Parquet
+    # cache (coming back with empty object categories), so they are left out
+    # and the remaining categories are cast to one dtype
+    with_rows = [frame for frame in data_frames if len(frame)] or data_frames
+    for column in _SOURCE_COLUMNS:
+        combined[column] = union_categoricals(
+            [frame[column].cat.set_categories(frame[column].cat.categories.astype(str)) for frame in with_rows],
+            sort_categories=True,
+        )
     # Derive incoming/outgoing type based on amount sign
-    combined["Type"] = np.where(combined["Amount"] >= 0, "Incoming", "Outgoing")
-    # Derive period columns
-    combined["Date"] = pd.to_datetime(combined["Date"], errors="coerce")
-    combined["PeriodMonth"] = combined["Date"].dt.to_period("M")
-    combined["PeriodQuarter"] = combined["Date"].dt.to_period("Q")
-    combined["PeriodYear"] = combined["Date"].dt.to_period("Y")
+    # Written as "not >= 0" so a missing amount stays "Outgoing"
+    combined["Type"] = pd.Categorical.from_codes(
+        (~(combined["Amount"].to_numpy() >= 0)).view(np.int8), categories=["Incoming", "Outgoing"]
+    )
+    # Derive period columns from one month count: quarter and year ordinals
+    # are months // 3 and months // 12 since the 1970 epoch, like Period's
+    dates = combined["Date"].to_numpy()
+    months = dates.astype("datetime64[M]").astype(np.int64)
+    missing = np.isnat(dates)
+    for column, freq, months_per_period in (("PeriodMonth", "M", 1), ("PeriodQuarter", "Q", 3), ("PeriodYear", "Y", 12)):
+        ordinals = np.where(missing, np.iinfo(np.int64).min, months // months_per_period)
+        combined[column] = pd.arrays.PeriodArray(ordinals, dtype=pd.PeriodDtype(freq))
+    _fill_running_balance(combined)
     return combined
 
 
+def _fill_running_balance(df: pd.DataFrame) -> None:
+    """Fill missing ``RunningBalance`` values with a per-account cumulative sum.
+
+    Rows without a balance are grouped by ``Bank`` and ``AccountLast4`` and
+    accumulated in date order, as ``groupby().cumsum()`` would, using one
+    sort and one prefix sum over the category codes.
+    """
+    rows = np.flatnonzero(df["RunningBalance"].isna().to_numpy())
+    if not len(rows):
+        return
+    last4_codes = df["AccountLast4"].cat.codes.to_numpy()
+    account = (
+        df["Bank"].cat.codes.to_numpy().astype(np.int64) * len(df["AccountLast4"].cat.categories) + last4_codes
+    )[rows]
+    order = np.lexsort((df["Date"].to_numpy()[rows], account))
+    rows, account = rows[order], account[order]
+    amounts = df["Amount"].to_numpy()[rows]
+    steps = np.nan_to_num(amounts)
+    totals = np.cumsum(steps)
+    # Subtract the running total reached before each account's first row
+    starts = np.flatnonzero(np.r_[True, account[1:] != account[:-1]])
+    offsets = np.repeat(totals[starts] - steps[starts], np.diff(np.r_[starts, len(rows)]))
+    balance = np.where(np.isnan(amounts), np.nan, totals - offsets)
+    df["RunningBalance"] = df["RunningBalance"].fillna(pd.Series(balance, index=df.index[rows]))
+
+
+def account_display(bank_account: pd.Series) -> pd.Series:
+    """Build "BANK 1234" labels from ``Bank_Account`` values like ``BOA_7259``.
+
+    Values without an underscore are upper-cased as-is and missing values
+    become ``"Unknown Account"``.
+    """
+    text = bank_account.astype("string")
+    parts = text.str.split("_")
+    labels = parts.str[0].str.upper() + " " + parts.str[1].str[-4:]
+    return labels.where(parts.str.len() >= 2, text.str.upper()).fillna("Unknown Account")
+
+
+# Low-cardinality text columns stored as categoricals in the cached frame
+_CATEGORY_COLUMNS: Tuple[str, ...] = (
+    "Bank_Account", "Account_Type", "Category1", "Category2", "Category3", "Tags", "Payer", "Payee",
+)
+
+
+def _join_list_value(value: Any) -> Any:
+    """Join a list or array cell into ``"a, b"``; other values pass through."""
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return ", ".join(str(item) for item in value)
+    return value
+
+
+# Persisted to disk so a restarted server skips re-parsing the file
+@st.cache_data(show_spinner=False, persist="disk")
+def _read_enhanced_transactions(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse the enhanced transaction file; ``mtime_ns`` only keys the cache."""
+    if path.endswith(".parquet"):
+        # Parquet keeps dtypes, so Date is already datetime
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+        # Convert Date column to datetime
+        df['Date'] = pd.to_datetime(df['Date'])
+    # Categorical so page filters and groupbys compare integer codes
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns:
+            if df[col].dtype == object:
+                # Parquet keeps list values (e.g. several Tags) as arrays,
+                # which cannot be categories; show them as one label
+                df[col] = df[col].map(_join_list_value, na_action='ignore')
+            df[col] = df[col].astype('category')
+    if 'Bank_Account' in df.columns:
+        df['AccountDisplay'] = account_display(df['Bank_Account']).astype('category')
+    return df
+
+
+def enhanced_transactions_file() -> Optional[str]:
+    """Return the enhanced transaction file to read, or ``None`` if missing.
+
+    The Parquet output of the processing pipeline is preferred; a CSV from
+    older installs is used only when no Parquet file exists.
+    """
+    stem = os.path.join(config.config.data_processed_dir, "transactions_combined_enhanced")
+    return next((path for path in (stem + ".parquet", stem + ".csv") if os.path.exists(path)), None)
+
+
 def load_enhanced_transactions() -> pd.DataFrame:
     """Load enhanced transaction data with mappings and additional columns.
     
     This function loads the enhanced combined transaction file that includes
     all the additional columns like categories, tags, payers, payees,
-    and formatted period columns.
+    and formatted period columns.  The parsed frame is cached and shared by
+    all pages until the file's modification time changes, so reprocessing
+    is picked up on the next rerun.  The cache is also persisted to disk so
+    it survives a server restart.
     
     Returns
     -------
     pd.DataFrame
         Enhanced transaction data with mappings applied.
     """
-    enhanced_file = os.path.join(config.config.data_processed_dir, "transactions_combined_enhanced.csv")
+    enhanced_file = enhanced_transactions_file()
     
-    if os.path.exists(enhanced_file):
-        try:
-            df = pd.read_csv(enhanced_file)
-            # Convert Date column to datetime
-            df['Date'] = pd.to_datetime(df['Date'])
-            return df
-        except Exception as e:
-            st.warning(f"Failed to load enhanced transaction file: {e}")
-            return pd.DataFrame()
-    else:
+    if enhanced_file is None:
         st.warning("Enhanced transaction file not found. Please ensure the data processing workflow has been run.")
         return pd.DataFrame()
+    try:
+        return _read_enhanced_transactions(enhanced_file, os.stat(enhanced_file).st_mtime_ns)
+    except Exception as e:
+        st.warning(f"Failed to load enhanced transaction file: {e}")
+        return pd.DataFrame()
 
 
 def save_combined_transactions(df: pd.DataFrame, filename: str = "transactions_combined.csv") -> str:
@@ -259,6 +523,10 @@ def save_combined_transactions(df: pd.DataFrame, filename: str = "transactions_c
     return out_path
 
 
+# Format string matching format_currency's default output, for bulk use
+CURRENCY_FMT = "${:,.2f}"
+
+
 def format_currency(value: float, decimals: int = 2) -> str:
     """Format a number as a currency string."""
     if value is None or (isinstance(value, float) and np.isnan(value)):
@@ -275,6 +543,20 @@ def format_percentage(value: float, decimals: int = 2) -> str:
     return f"{value * 100:.{decimals}f}%"
 
 
+def format_currency_series(values: pd.Series, decimals: int = 2) -> pd.Series:
+    """Format a numeric Series like :func:`format_currency`.
+
+    The format string is built once and mapped as a bound method, with
+    missing values skipped and shown as ``"-"``.
+    """
+    return values.map(f"${{:,.{decimals}f}}".format, na_action="ignore").fillna("-")
+
+
+def format_percentage_series(values: pd.Series, decimals: int = 2) -> pd.Series:
+    """Format a Series of decimals like :func:`format_percentage`."""
+    return (values * 100).map(f"{{:.{decimals}f}}%".format, na_action="ignore").fillna("-")
+
+
 def create_metric_row(metrics: List[Dict[str, Any]], columns: int = 4) -> None:
     """Render a row of metric widgets using Streamlit columns."""
     cols = st.columns(columns)
@@ -297,94 +579,218 @@ def create_bar_chart(df: pd.DataFrame, x_col: str, y_col: str, title: str = "")
     st.plotly_chart(fig, **get_chart_config())
 
 
-def display_dataframe(df: pd.DataFrame, title: str = "") -> None:
-    """Display a DataFrame with an optional title."""
+def display_dataframe(df: pd.DataFrame, title: str = "", formats: Optional[Dict[str, Any]] = None) -> None:
+    """Display a DataFrame with an optional title.
+
+    ``formats`` maps column names to format strings (e.g. ``CURRENCY_FMT``)
+    or callables;
+    they are applied at render time through a Styler on the shown rows only,
+    so the underlying numeric columns are never converted to strings.
+    """
     if title:
         st.subheader(title)
-    st.dataframe(df.head(config.config.max_display_rows), **get_table_config())
+    data = df.head(config.config.max_display_rows)
+    if formats:
+        data = data.style.format(formats, na_rep="-")
+    st.dataframe(data, **get_table_config())
 
 
 def add_download_button(df: pd.DataFrame, filename: str, button_text: str = "Download CSV") -> None:
-    """Add a CSV download button for a DataFrame."""
-    csv = df.to_csv(index=False)
+    """Add a CSV download button for a DataFrame.
+
+    The file is written by Arrow's C++ CSV writer when the button is
+    clicked.  Frames Arrow cannot convert, such as object columns with
+    mixed types, fall back to ``DataFrame.to_csv``.
+    """
+
+    def build_csv() -> bytes:
+        try:
+            buffer = io.BytesIO()
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+            return buffer.getvalue()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return df.to_csv(index=False).encode("utf-8")
+
     st.download_button(
         label=button_text,
-        data=csv,
+        data=build_csv,
         file_name=filename,
         mime="text/csv",
     )
 
 
-def add_excel_download_button(df: pd.DataFrame, filename: str, button_text: str = "Download Excel") -> None:
-    """Add an Excel download button for a DataFrame."""
+def add_arrow_download_button(df: pd.DataFrame, filename: str, button_text: str = "Download Arrow") -> None:
+    """Add a zstd-compressed Arrow (Feather v2) download button for a DataFrame.
+
+    Keeps column types and is far smaller than CSV for large tables.  Like
+    the CSV button, the file is written when the button is clicked; object
+    columns Arrow cannot convert are written as text.
+    """
+
+    def build_arrow() -> bytes:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            text_columns = {col: "string" for col in df.columns if df[col].dtype == object}
+            table = pa.Table.from_pandas(df.astype(text_columns), preserve_index=False)
+        buffer = io.BytesIO()
+        pa_feather.write_feather(table, buffer, compression="zstd")
+        return buffer.getvalue()
+
+    st.download_button(
+        label=button_text,
+        data=build_arrow,
+        file_name=filename,
+        mime="application/vnd.apache.arrow.file",
+    )
+
+
+def _excel_cell(value: Any) -> Any:
+    """Convert a value from a streamable column to what ``to_excel`` writes.
+
+    Missing values become blank cells and infinities ``"inf"``/``"-inf"``.
+    """
+    if value is None or value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, float):
+        if np.isnan(value):
+            return None
+        if np.isinf(value):
+            return "-inf" if value < 0 else "inf"
+    return value
+
+
+def _can_stream_to_excel(df: pd.DataFrame) -> bool:
+    """Whether every column holds numbers, booleans, naive datetimes or text.
+
+    Those are the types :func:`_excel_cell` converts exactly as
+    ``DataFrame.to_excel`` does; anything else (periods, dates, objects,
+    categoricals) goes through ``to_excel`` itself.
+    """
+    if isinstance(df.columns, pd.MultiIndex):
+        return False
+    return all(
+        isinstance(dtype, pd.StringDtype)
+        or (isinstance(dtype, np.dtype) and dtype.kind in "biufM")
+        or (not isinstance(dtype, np.dtype) and dtype.kind in "biuf")
+        for dtype in df.dtypes
+    )
+
+
+def _excel_bytes(df: pd.DataFrame) -> bytes:
+    """Write ``df`` to an xlsx workbook with a single "Data" sheet.
+
+    Frames of simple column types are streamed with xlsxwriter's
+    ``constant_memory`` mode, which flushes each row as it is written.  That
+    mode only supports row-by-row writes and ``to_excel`` writes column by
+    column, so those rows are written here, matching ``to_excel``'s cells and
+    formats.  Other frames use ``to_excel``.
+    """
     buffer = io.BytesIO()
-    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
-        df.to_excel(writer, index=False, sheet_name="Data")
+    if not _can_stream_to_excel(df):
+        with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+            df.to_excel(writer, index=False, sheet_name="Data")
+        return buffer.getvalue()
+    workbook = xlsxwriter.Workbook(
+        buffer,
+        {"constant_memory": True, "use_zip64": True, "default_date_format": "YYYY-MM-DD HH:MM:SS"},
+    )
+    worksheet = workbook.add_worksheet("Data")
+    worksheet.write_row(0, 0, [str(col) for col in df.columns])
+    columns = [[_excel_cell(value) for value in series.to_numpy(dtype=object)] for _, series in df.items()]
+    for row_number, row in enumerate(zip(*columns), start=1):
+        worksheet.write_row(row_number, 0, row)
+    workbook.close()
+    return buffer.getvalue()
+
+
+def add_excel_download_button(df: pd.DataFrame, filename: str, button_text: str = "Download Excel") -> None:
+    """Add an Excel download button for a DataFrame.
+
+    The workbook (see :func:`_excel_bytes`) is only built when the button
+    is clicked, off the script thread.
+    """
     st.download_button(
         label=button_text,
-        data=buffer.getvalue(),
+        data=lambda: _excel_bytes(df),
         file_name=filename,
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
 
 
-def apply_custom_css() -> None:
-    """Apply custom CSS to refine Streamlit's look and feel."""
-    # This CSS replicates the clean sidebar styling from the original
-    st.markdown(
-        """
-
-        <style>
-        /* Sidebar styling */
-        .css-1d391kg {
-            background-color: #f8f9fa;
-        }
-        /* Sidebar header styling */
-        .css-1d391kg h2 {
-            color: #1f2937;
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-        }
-        /* Expander styling */
-        .streamlit-expanderHeader {
-            background-color: #e5e7eb;
-            border-radius: 6px;
-            padding: 8px 12px;
-            margin: 4px 0;
-            font-weight: 500;
-            color: #374151;
-        }
-        .streamlit-expanderHeader:hover {
-            background-color: #d1d5db;
-        }
-        /* Button styling in sidebar */
-        .css-1d391kg button {
-            background-color: transparent;
-            border: none;
-            padding: 8px 12px;
-            margin: 2px 0;
-            border-radius: 4px;
-            text-align: left;
-            width: 100%;
-            transition: background-color 0.2s;
-        }
-        .css-1d391kg button:hover {
-            background-color: #e5e7eb;
-        }
-        /* User info section */
-        .css-1d391kg .stMarkdown {
-            margin-top: 1rem;
-        }
-        /* Divider styling */
-        .css-1d391kg hr {
-            margin: 1rem 0;
-            border-color: #d1d5db;
-        }
-        /* Page content styling */
-        .main .block-container {
-            padding-top: 2rem;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
\ No newline at end of file
+# This CSS replicates the clean sidebar styling from the original
+_CUSTOM_CSS = """
+<style>
+/* Sidebar styling */
+.css-1d391kg {
+    background-color: #f8f9fa;
+}
+/* Sidebar header styling */
+.css-1d391kg h2 {
+    color: #1f2937;
+    font-weight: 600;
+    margin-bottom: 0.5rem;
+}
+/* Expander styling */
+.streamlit-expanderHeader {
+    background-color: #e5e7eb;
+    border-radius: 6px;
+    padding: 8px 12px;
+    margin: 4px 0;
+    font-weight: 500;
+    color: #374151;
+}
+.streamlit-expanderHeader:hover {
+    background-color: #d1d5db;
+}
+/* Button styling in sidebar */
+.css-1d391kg button {
+    background-color: transparent;
+    border: none;
+    padding: 8px 12px;
+    margin: 2px 0;
+    border-radius: 4px;
+    text-align: left;
+    width: 100%;
+    transition: background-color 0.2s;
+}
+.css-1d391kg button:hover {
+    background-color: #e5e7eb;
+}
+/* User info section */
+.css-1d391kg .stMarkdown {
+    margin-top: 1rem;
+}
+/* Divider styling */
+.css-1d391kg hr {
+    margin: 1rem 0;
+    border-color: #d1d5db;
+}
+/* Page content styling */
+.main .block-container {
+    padding-top: 2rem;
+}
+</style>
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a ``<style>`` block."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return re.sub(r"\s+", " ", css).strip()
+
+
+# Minified once at import; the page still has to emit it on every rerun,
+# because Streamlit removes elements a rerun does not draw again
+_CUSTOM_CSS_MINIFIED = _minify_css(_CUSTOM_CSS)
+
+
+def apply_custom_css(extra_css: str = "") -> None:
+    """Apply custom CSS to refine Streamlit's look and feel.
+
+    ``extra_css`` is emitted in the same element so callers adding their
+    own ``<style>`` blocks do not send a separate message per rerun.
+    """
+    # st.html skips the markdown parser; style-only HTML takes up no space
+    st.html(extra_css + _CUSTOM_CSS_MINIFIED)